@@ -10,22 +10,135 @@
 import logging
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 from urllib.parse import parse_qsl
 
+import orjson
 import polars as pl
 import requests
-import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config_loader import load_yaml_config
 
 # %% --------------------------------------------
 # * Config
 
 ODDS_CONFIG_FILE = Path(__file__).parents[1] / "cfg" / "api_config.yaml"
 
+# Shared HTTP session: keep-alive connection pool and retries on transient errors
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# Schema of the match-level Odds API fields (skips inference, drops bookmakers)
+_ODDS_API_SCHEMA = pl.Schema(
+    {
+        "id": pl.String,
+        "sport_key": pl.String,
+        "sport_title": pl.String,
+        "commence_time": pl.String,
+        "home_team": pl.String,
+        "away_team": pl.String,
+    },
+)
+
+# Empty prediction columns filled in later by the LLM workflow
+_PREDICTION_PLACEHOLDERS = (
+    pl.lit("", dtype=pl.String).alias("reasoning"),
+    pl.lit(0, dtype=pl.Int32).alias("prediction_home"),
+    pl.lit(0, dtype=pl.Int32).alias("prediction_away"),
+    pl.lit("", dtype=pl.String).alias("outlook"),
+    pl.lit(0, dtype=pl.Int32).alias("validity"),
+)
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# %% --------------------------------------------
+# * Support Functions
+
+
+@lru_cache(maxsize=8)
+def _commence_time_expr(target_timezone: str) -> pl.Expr:
+    """Build the expression formatting 'commence_time' in the target time zone.
+
+    Parameters
+    ----------
+    target_timezone : str
+        The target timezone for datetime conversion, e.g. "Europe/Berlin".
+
+    Returns
+    -------
+    pl.Expr
+        Expression producing the 'commence_time_str' column.
+
+    """
+    return (
+        pl.col("commence_time")
+        .str.strptime(pl.Datetime, "%Y-%m-%dT%H:%M:%SZ")  # Naive DT
+        .dt.replace_time_zone("UTC")  # Reset time zone to UTC
+        .dt.convert_time_zone(target_timezone)  # Set to Target Zone
+        .dt.strftime("%d.%m.%Y %H:%M")  # Format as string
+        .alias("commence_time_str")  # Rename to commence_time_str
+    )
+
+
+@lru_cache(maxsize=4)
+def _odds_summary_expr(*, named_teams: bool, additional_info: bool) -> pl.Expr:
+    """Build the expression for the odds summary used as LLM prompt.
+
+    Parameters
+    ----------
+    named_teams : bool
+        Whether to use named teams in the summary or to anonymize them.
+    additional_info : bool
+        Whether to append the sport title to the summary.
+
+    Returns
+    -------
+    pl.Expr
+        Expression producing the 'odds_summary' column.
+
+    """
+    if named_teams:
+        odds_summary = pl.format(
+            "{}: {}, {}: {}, draw: {}",
+            "home_team",
+            "odds_home",
+            "away_team",
+            "odds_away",
+            "odds_draw",
+        )
+    else:
+        odds_summary = pl.format(
+            "home: {}, away: {}, draw: {}",
+            "odds_home",
+            "odds_away",
+            "odds_draw",
+        )
+
+    # Add additional information if specified
+    if additional_info:
+        odds_summary = pl.format("{}, {}", odds_summary, "sport_title")
+
+    return odds_summary.alias("odds_summary")
+
+
 # %% --------------------------------------------
 # * Class Definitions
 
@@ -47,8 +160,7 @@ class BaseAPI(ABC):
 
         # Load Config
         try:
-            with ODDS_CONFIG_FILE.open(encoding="utf-8") as f:
-                self.config = yaml.safe_load(f)[self.api_name]
+            self.config = load_yaml_config(ODDS_CONFIG_FILE)[self.api_name]
         except FileNotFoundError as exc:
             logger.exception("Config file not found: %s", ODDS_CONFIG_FILE)
             error_msg = f"Config file not found: {ODDS_CONFIG_FILE}"
@@ -77,6 +189,40 @@ class BaseAPI(ABC):
 
         """
 
+    def fetch_many(self, sport_keys: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch data from the API for several sports concurrently.
+
+        Requests are I/O bound, so they are fanned out over a small thread pool.
+
+        Parameters
+        ----------
+        sport_keys : list[str]
+            The keys of the sports for which to retrieve odds.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            The raw data retrieved from the API per sport key (in input order).
+            Sports for which the request failed are logged and omitted.
+
+        """
+        if not sport_keys:
+            return {}
+
+        results: dict[str, dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(sport_keys))) as executor:
+            futures = {
+                sport_key: executor.submit(self.fetch_api_data, sport_key)
+                for sport_key in sport_keys
+            }
+            for sport_key, future in futures.items():
+                try:
+                    results[sport_key] = future.result()
+                except Exception:
+                    logger.exception("Failed to fetch data for sport %s", sport_key)
+
+        return results
+
     @abstractmethod
     def process_api_data(
         self,
@@ -118,6 +264,11 @@ class OddsAPI(BaseAPI):
         self.sports_mapping = self.config["sports_mapping"]
         self.bookmaker_priority = self.config["bookmaker_priority"]
 
+        # Rank the bookmakers by priority once (lowest rank is preferred)
+        self._bookmaker_ranks = {
+            bookmaker: rank for rank, bookmaker in enumerate(self.bookmaker_priority)
+        }
+
     def fetch_api_data(self, sport_key: str) -> dict[str, Any]:
         """Fetch odds data from the Odds API for a specific sport.
 
@@ -156,7 +307,7 @@ class OddsAPI(BaseAPI):
 
         # Fetch data from the API
         logger.debug("Fetching odds data for sport: %s", sport_key)
-        response = requests.get(url, params=request_params, timeout=10)
+        response = _SESSION.get(url, params=request_params, timeout=(3.05, 10))
 
         # Check if the response was successful
         if response.status_code != 200:
@@ -177,11 +328,50 @@ class OddsAPI(BaseAPI):
             )
             raise requests.exceptions.HTTPError(error_message, response=response)
 
-        api_result = response.json()
-        logger.info("Successfully fetched odds data for sport: %s", sport_key)
+        api_result = orjson.loads(response.content)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Successfully fetched odds data for sport: %s | "
+                "API credits remaining: %s",
+                sport_key,
+                response.headers.get("x-requests-remaining", "unknown"),
+            )
 
         return api_result
 
+    def _select_odds(self, match: dict[str, Any]) -> tuple[float, float, float]:
+        """Select the home/away/draw odds of the top-priority bookmaker.
+
+        Parameters
+        ----------
+        match : dict[str, Any]
+            A single match as returned by the Odds API.
+
+        Returns
+        -------
+        tuple[float, float, float]
+            The home, away and draw odds, or zeros if no prioritized bookmaker
+            offers complete odds for the match.
+
+        """
+        home_team, away_team = match["home_team"], match["away_team"]
+        best_rank, best_odds = len(self._bookmaker_ranks), (0.0, 0.0, 0.0)
+
+        for bookmaker in match["bookmakers"]:
+            rank = self._bookmaker_ranks.get(bookmaker["key"], best_rank)
+            if rank >= best_rank or not bookmaker["markets"]:
+                continue
+
+            prices: dict[str, float] = {}
+            for outcome in bookmaker["markets"][0]["outcomes"]:
+                prices.setdefault(outcome["name"], outcome["price"])
+
+            if home_team in prices and away_team in prices and "Draw" in prices:
+                best_rank = rank
+                best_odds = (prices[home_team], prices[away_team], prices["Draw"])
+
+        return best_odds
+
     def process_api_data(
         self,
         api_result: dict[str, Any],
@@ -210,107 +400,33 @@ class OddsAPI(BaseAPI):
 
         """
         logger.debug("Processing API data...")
-        data = pl.DataFrame(api_result)
-
-        # Create a new 'commence_time_str' as str, with correct time zone
-        data = data.with_columns(
-            pl.col("commence_time")
-            .str.strptime(pl.Datetime, "%Y-%m-%dT%H:%M:%SZ")  # Naive DT
-            .dt.replace_time_zone("UTC")  # Reset time zone to UTC
-            .dt.convert_time_zone(target_timezone)  # Set to Target Zone
-            .dt.strftime("%d.%m.%Y %H:%M")  # Format as string
-            .alias("commence_time_str"),  # Rename to commence_time_str
+        # The Odds API returns a list of matches: pick the odds straight from the
+        # raw JSON and build the (flat) frame once
+        matches = cast("list[dict[str, Any]]", api_result)
+        odds_columns = ["odds_home", "odds_away", "odds_draw"]
+        odds = pl.LazyFrame(
+            [self._select_odds(match) for match in matches],
+            schema=dict.fromkeys(odds_columns, pl.Float64),
+            orient="row",
         )
-
-        # Add necessary columns for odds, reasoning, and predictions
-        data = data.with_columns(
-            pl.lit("").alias("odds_summary"),
-            pl.lit(0.0).alias("odds_home"),
-            pl.lit(0.0).alias("odds_away"),
-            pl.lit(0.0).alias("odds_draw"),
-            pl.lit("").alias("reasoning"),
-            pl.lit(0).alias("prediction_home"),
-            pl.lit(0).alias("prediction_away"),
-            pl.lit("").alias("outlook"),
-            pl.lit(0).alias("validity"),
+        data = pl.concat(
+            [pl.LazyFrame(matches, schema=_ODDS_API_SCHEMA, strict=False), odds],
+            how="horizontal",
         )
 
-        # Iterate over each row to process odds and generate predictions
-        for i in range(data.shape[0]):
-            bookmakers_tuple = data.select("bookmakers").row(i)[0]
-            bookmakers_dict: dict[str, tuple[float, float, float]] = {}
-            home_team = data[i, "home_team"]
-            away_team = data[i, "away_team"]
-
-            # Extract the odds for home, away, and draw outcomes
-            for bookmaker in bookmakers_tuple:
-                outcomes = bookmaker["markets"][0]["outcomes"]
-                cur_home = next(
-                    (
-                        outcome["price"]
-                        for outcome in outcomes
-                        if outcome["name"] == home_team
-                    ),
-                    None,
-                )
-                cur_away = next(
-                    (
-                        outcome["price"]
-                        for outcome in outcomes
-                        if outcome["name"] == away_team
-                    ),
-                    None,
-                )
-                cur_draw = next(
-                    (
-                        outcome["price"]
-                        for outcome in outcomes
-                        if outcome["name"] == "Draw"
-                    ),
-                    None,
-                )
-                if cur_home and cur_away and cur_draw:
-                    bookmakers_dict[bookmaker["key"]] = (
-                        cur_home,
-                        cur_away,
-                        cur_draw,
-                    )
-
-            # Initialize variables for home, away, and draw odds
-            odds_home, odds_away, odds_draw = 0.0, 0.0, 0.0
-            # Iterate over the prioritized bookmakers
-            for bookmaker in self.bookmaker_priority:
-                # Try to get the odds for the current bookmaker
-                odds_tuple = bookmakers_dict.get(bookmaker)
-                if odds_tuple is not None:
-                    # Update home, away, and draw with the valid odds
-                    odds_home, odds_away, odds_draw = odds_tuple
-                    break
-
-            # Add the processed odds to the DataFrame
-            if named_teams:
-                home_team = data[i, "home_team"]
-                away_team = data[i, "away_team"]
-                odds_summary = (
-                    f"{home_team}: {odds_home}, {away_team}: {odds_away}, "
-                    f"draw: {odds_draw}"
-                )
-            else:
-                odds_summary = (
-                    f"home: {odds_home}, away: {odds_away}, draw: {odds_draw}"
-                )
-
-            # Add additional information if specified
-            if additional_info:
-                odds_summary = f"{odds_summary}, {data[i, 'sport_title']}"
-
-            data[i, "odds_summary"] = odds_summary
-            data[i, "odds_home"] = odds_home
-            data[i, "odds_away"] = odds_away
-            data[i, "odds_draw"] = odds_draw
-
-        # Remove nested columns
-        data = data.drop("bookmakers")
+        # Assemble all derived columns in a single projection: the formatted
+        # commence time, odds summary, odds and the empty prediction columns.
+        # The whole query is only materialized once, at the final collect
+        data = data.select(
+            pl.exclude(odds_columns),
+            _commence_time_expr(target_timezone),
+            _odds_summary_expr(
+                named_teams=named_teams,
+                additional_info=additional_info,
+            ),
+            *odds_columns,
+            *_PREDICTION_PLACEHOLDERS,
+        ).collect()
 
         logger.debug("Data processing completed successfully.")
         return data
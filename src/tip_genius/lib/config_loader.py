@@ -0,0 +1,55 @@
+"""Module for loading (and caching) the YAML config files."""
+
+# * Author(s): Thomas Glanzer
+# * Creation : Oct 2026
+# * License: MIT license
+
+# %% --------------------------------------------
+# * Libraries
+
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader
+
+# %% --------------------------------------------
+# * Functions
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml(path: Path, mtime_ns: int, size: int) -> Mapping[str, Any]:  # noqa: ARG001
+    """Parse a YAML file, cached by path, modification time and size."""
+    with path.open(encoding="utf-8") as f:
+        return MappingProxyType(yaml.load(f, Loader=YAMLLoader))
+
+
+def load_yaml_config(path: Path) -> Mapping[str, Any]:
+    """Load a YAML config file, re-parsing it only if the file has changed.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the YAML file.
+
+    Returns
+    -------
+    Mapping[str, Any]
+        Read-only view of the parsed config, shared between all callers
+        (nested values must not be modified).
+
+    Raises
+    ------
+    FileNotFoundError
+        If the config file does not exist.
+
+    """
+    stat = path.stat()
+    return _parse_yaml(path, stat.st_mtime_ns, stat.st_size)
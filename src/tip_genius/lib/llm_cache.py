@@ -0,0 +1,163 @@
+"""Module for a persistent (on-disk) cache of LLM responses."""
+
+# * Author(s): Thomas Glanzer
+# * Creation : Oct 2026
+# * License: MIT license
+
+# %% --------------------------------------------
+# * Libraries
+
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+from functools import cache
+from pathlib import Path
+from typing import Literal, cast, get_args
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# %% --------------------------------------------
+# * Config
+
+CacheMode = Literal["on", "read_only", "write_only", "off"]
+
+LLM_CACHE_MODE_ENV_NAME = "LLM_CACHE_MODE"
+# Part of every cache key, bump it when the expected response schema changes
+LLM_CACHE_VERSION = 1
+LLM_CACHE_FILE = Path(__file__).parents[3] / ".cache" / "llm_responses.sqlite"
+
+# %% --------------------------------------------
+# * Class Definitions
+
+
+class LLMResponseCache:
+    """Thread-safe SQLite cache of LLM responses, keyed by a request hash.
+
+    The cache is best effort: database errors (e.g. a locked, full or corrupt
+    file) are logged once and treated as cache misses or skipped writes.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the SQLite database file (created if it does not exist).
+    mode : CacheMode, optional
+        'on' (read and write), 'read_only', 'write_only' or 'off', by default 'on'.
+
+    Attributes
+    ----------
+    readable : bool
+        Whether cached responses are returned.
+    writable : bool
+        Whether new responses are stored.
+    hits : int
+        Number of lookups answered from the cache.
+    misses : int
+        Number of lookups not found in the cache.
+
+    """
+
+    def __init__(self, path: Path, mode: CacheMode = "on") -> None:
+        """Open (or create) the cache database."""
+        self.path = path
+        self.readable = mode in ("on", "read_only")
+        self.writable = mode in ("on", "write_only")
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._error_logged = False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by all threads, serialized by the lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key BLOB PRIMARY KEY, response TEXT NOT NULL)",
+            )
+
+    def get(self, key: bytes) -> str | None:
+        """Return the cached response for a key, or None if not cached."""
+        if not self.readable:
+            return None
+        with self._lock:
+            try:
+                row = self._connection.execute(
+                    "SELECT response FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            except sqlite3.Error as exc:
+                self._log_error(exc)
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: bytes, response: str) -> None:
+        """Store the response for a key (replacing an existing entry)."""
+        if not self.writable:
+            return
+        with self._lock:
+            try:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO responses (key, response) "
+                        "VALUES (?, ?)",
+                        (key, response),
+                    )
+            except sqlite3.Error as exc:
+                self._log_error(exc)
+
+    def close(self) -> None:
+        """Close the database connection (later lookups are misses)."""
+        with self._lock:
+            self._connection.close()
+
+    def _log_error(self, exc: sqlite3.Error) -> None:
+        """Log the first database error, the cache keeps working best effort."""
+        if not self._error_logged:
+            self._error_logged = True
+            logger.warning("LLM response cache error (%s): %s", self.path, exc)
+
+
+# %% --------------------------------------------
+# * Functions
+
+
+@cache
+def get_llm_cache() -> LLMResponseCache | None:
+    """Get the process wide LLM response cache, as set by 'LLM_CACHE_MODE'.
+
+    The environment variable is read on first use (after .env files are loaded).
+    Supported modes are 'on', 'read_only', 'write_only' and 'off' (default).
+
+    Returns
+    -------
+    LLMResponseCache or None
+        The shared cache, or None if caching is disabled (or unavailable).
+
+    """
+    mode = os.environ.get(LLM_CACHE_MODE_ENV_NAME, "off").strip().lower()
+    if mode not in get_args(CacheMode):
+        logger.warning(
+            "Invalid %s '%s', LLM response cache disabled.",
+            LLM_CACHE_MODE_ENV_NAME,
+            mode,
+        )
+        return None
+    if mode == "off":
+        return None
+
+    try:
+        llm_cache = LLMResponseCache(LLM_CACHE_FILE, mode=cast("CacheMode", mode))
+    except (OSError, sqlite3.Error):
+        logger.exception("Failed to open LLM response cache: %s", LLM_CACHE_FILE)
+        return None
+
+    atexit.register(llm_cache.close)
+    logger.info("LLM response cache enabled (%s): %s", mode, LLM_CACHE_FILE)
+    return llm_cache
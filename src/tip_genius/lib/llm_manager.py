@@ -7,26 +7,177 @@
 # %% --------------------------------------------
 # * Libs and Config
 
+import hashlib
 import logging
 import os
+import re
+import threading
 import time
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar, Literal
 
+import orjson
 import requests
-import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from .config_loader import load_yaml_config
+from .llm_cache import LLM_CACHE_VERSION, LLMResponseCache, get_llm_cache
 from .llm_prompts import Prompt
 
 LLM_CONFIG_FILE = Path(__file__).parents[1] / "cfg" / "llm_config.yaml"
 
+# Default location of the prediction text in the provider responses
+_RESPONSE_PATHS: dict[str, tuple[str | int, ...]] = {
+    "anthropic": ("content", 0, "text"),
+    "openai": ("choices", 0, "message", "content"),
+}
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# %% --------------------------------------------
+# * Support Functions
+
+
+def _parse_response_path(response_path: str) -> tuple[str | int, ...]:
+    """Parse a response path like 'choices[0].message.content' into its keys.
+
+    Parameters
+    ----------
+    response_path : str
+        Dotted path to the prediction text, list indices in square brackets.
+
+    Returns
+    -------
+    tuple[str | int, ...]
+        The dict keys (str) and list indices (int) to follow, in order.
+
+    """
+    return tuple(
+        int(key) if key.isdigit() else key
+        for key in re.findall(r"[^.\[\]]+", response_path)
+    )
+
+
 # %% --------------------------------------------
 # * Class Definitions
 
 
+class TokenBucket:
+    """Thread-safe token bucket to respect a requests-per-minute rate limit.
+
+    Parameters
+    ----------
+    rate_per_sec : float
+        Number of tokens refilled per second.
+    capacity : float, optional
+        Maximum number of tokens (burst size), by default 1.
+
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float = 1) -> None:
+        """Initialize the TokenBucket (full)."""
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill (lock must be held)."""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_sec)
+        self.last_refill = now
+
+    def acquire(self, n: float = 1) -> None:
+        """Take n tokens from the bucket, sleeping until they are available.
+
+        Parameters
+        ----------
+        n : float, optional
+            Number of tokens to take, by default 1.
+
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= n  # Reserve the tokens, even if they are owed
+            sleep_duration = -self.tokens / self.rate_per_sec
+
+        if sleep_duration > 0:
+            logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_duration)
+            time.sleep(sleep_duration)
+
+    def drain(self, seconds: float) -> None:
+        """Empty the bucket so no tokens are available for the given time.
+
+        Parameters
+        ----------
+        seconds : float
+            Time in seconds (e.g. from a 'Retry-After' header) to block for.
+
+        """
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, -seconds * self.rate_per_sec)
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries (least recently used entries are evicted).
+    ttl : float
+        Time to live of an entry in seconds.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups answered from the cache.
+    misses : int
+        Number of lookups not found in the cache (or expired).
+
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the (empty) TTLCache."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> str | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, value: str) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
 class LLMManager:
     """Class for interacting with various LLM providers to retrieve predictions.
 
@@ -37,6 +188,9 @@ class LLMManager:
         A config with required parameters will be loaded from the config file.
     prediction_type : str, optional
         The type of prediction to use, by default "Default".
+    history_size : int, optional
+        Number of recent responses to keep in 'full_response_list',
+        by default 0 (no history is kept).
 
     Attributes
     ----------
@@ -54,10 +208,18 @@ class LLMManager:
         Base URL for the API.
     model : str
         Model name to use.
-    kwargs : dict
+    kwargs : Mapping
         Additional keyword arguments for the LLM.
-    full_response_list : list
-        A list to store full responses from the LLM.
+    cache : TTLCache or None
+        Cache of recent validated predictions per prompt (if 'cache_ttl' is
+        configured), filled through ``cache_prediction``.
+    response_cache : LLMResponseCache or None
+        Persistent cache of predictions across runs (if 'LLM_CACHE_MODE' is set).
+    full_response_list : deque or None
+        The last 'history_size' responses from the LLM (prediction, model and
+        token usage only), or None if no history is kept.
+    session : requests.Session
+        Keep-alive HTTP session, shared by all instances with the same base URL.
 
     Raises
     ------
@@ -76,11 +238,26 @@ class LLMManager:
 
     """
 
-    def __init__(self, provider: str, prediction_type: str = "Default") -> None:
+    # Keep-alive HTTP sessions shared between instances, keyed by base URL
+    _sessions: ClassVar[dict[str, requests.Session]] = {}
+    _sessions_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Rate limiters shared between instances, keyed by provider
+    _rate_limiters: ClassVar[dict[str, TokenBucket]] = {}
+    _rate_limiters_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        provider: str,
+        prediction_type: str = "Default",
+        history_size: int = 0,
+    ) -> None:
         """Initialize the LLMManager."""
         self.provider = provider.lower()
         self.prediction_type = prediction_type
-        self.full_response_list: list[Any] = []
+        self.full_response_list: deque[dict[str, Any]] | None = (
+            deque(maxlen=history_size) if history_size > 0 else None
+        )
 
         logger.debug("Initializing LLMManager with provider: %s", self.provider)
 
@@ -92,8 +269,7 @@ class LLMManager:
                 super().__init__(message)
 
         try:
-            with LLM_CONFIG_FILE.open(encoding="utf-8") as f:
-                self.config = yaml.safe_load(f)[self.provider]
+            self.config = load_yaml_config(LLM_CONFIG_FILE)[self.provider]
         except FileNotFoundError as exc:
             logger.exception("Config file not found: %s", LLM_CONFIG_FILE)
             error_message = f"Config file not found: {LLM_CONFIG_FILE}"
@@ -113,39 +289,347 @@ class LLMManager:
 
         # Get other parameters
         self.system_prompt = Prompt.get(self.prediction_type)
+        # The system prompt never changes, so encode it to JSON only once
+        self._system_prompt_json = orjson.Fragment(orjson.dumps(self.system_prompt))
+        # Cached responses are only valid for the same instructions
+        self._system_prompt_digest = hashlib.blake2b(
+            self.system_prompt.encode(),
+            digest_size=16,
+        ).hexdigest()
         self.base_url = self.config["base_url"]
         self.operation = self.config["operation"]
         self.model = self.config["model"]
-        self.kwargs: dict[str, Any] = self.config.get("kwargs", {})
+        self.kwargs: Mapping[str, Any] = MappingProxyType(self.config.get("kwargs", {}))
         self.optional_headers: dict[str, str] = self.config.get("optional_headers", {})
         self.rate_limit: float = self.config.get(
             "api_rate_limit",
             0,
         )  # 0 or negative value means no rate limit
+        self.session = self._get_session(
+            self.base_url,
+            pool_maxsize=self.config.get("pool_maxsize", 16),
+            prewarm=self.config.get("prewarm", False),
+        )
+        self.rate_limiter = (
+            self._get_rate_limiter(self.provider, self.rate_limit)
+            if self.rate_limit > 0
+            else None
+        )
+
+        # Optionally answer repeated identical prompts from a TTL cache
+        cache_ttl: float = self.config.get("cache_ttl", 0)
+        self.cache = (
+            TTLCache(maxsize=self.config.get("cache_size", 1024), ttl=cache_ttl)
+            if cache_ttl > 0
+            else None
+        )
+        # Optionally persist responses across runs (LLM_CACHE_MODE environment)
+        self.response_cache: LLMResponseCache | None = get_llm_cache()
+
+        # Determine the provider API flavour once (OpenAI compatible by default)
+        self._kind: Literal["anthropic", "google", "openai"] = (
+            "anthropic"
+            if self.provider.startswith("anthropic")
+            else "google"
+            if self.provider.startswith("google")
+            else "openai"
+        )
+
+        # Pre-build the provider specific URL, headers and request/response handlers
+        self._headers = {"content-type": "application/json"}
+        if self._kind == "anthropic":
+            self._url = f"{self.base_url}/{self.operation}"
+            self._headers["x-api-key"] = self.api_key
+            self._headers["anthropic-version"] = "2023-06-01"
+        elif self._kind == "google":
+            self._url = f"{self.base_url}/models/{self.model}:{self.operation}"
+            self._headers["x-goog-api-key"] = self.api_key
+        else:  # OpenAI and compatible: Mistral, OpenRouter, etc.
+            self._url = f"{self.base_url}/{self.operation}"
+            self._headers["authorization"] = f"Bearer {self.api_key}"
+        self._build_payload = {
+            "anthropic": self._build_anthropic_payload,
+            "google": self._build_google_payload,
+            "openai": self._build_openai_payload,
+        }[self._kind]
+
+        # Resolve where the prediction is found in the response (a 'response_path'
+        # in the config overrides the provider default)
+        response_path = self.config.get("response_path")
+        if response_path is None and self._kind == "google":
+            self._extract_prediction = self._extract_google_prediction
+        else:
+            self._response_path = (
+                _parse_response_path(response_path)
+                if response_path is not None
+                else _RESPONSE_PATHS[self._kind]
+            )
+            self._extract_prediction = self._extract_path_prediction
+
+        # Add optional headers if specified (e.g., for OpenRouter)
+        self._headers.update(self.optional_headers)
+
+    @classmethod
+    def _get_session(
+        cls,
+        base_url: str,
+        pool_maxsize: int,
+        *,
+        prewarm: bool = False,
+    ) -> requests.Session:
+        """Get (or create) the pooled HTTP session for a base URL.
+
+        Parameters
+        ----------
+        base_url : str
+            Base URL of the LLM API.
+        pool_maxsize : int
+            Maximum number of connections kept alive in the pool.
+        prewarm : bool, optional
+            Whether to open a connection to the API in the background when the
+            session is created, by default False.
+
+        Returns
+        -------
+        requests.Session
+            The session shared by all instances using this base URL.
+
+        """
+        with cls._sessions_lock:
+            session = cls._sessions.get(base_url)
+            if session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=pool_maxsize,
+                    # Retry connection failures and server errors only: 429s are
+                    # left to the rate limiter and the caller's retry loop, and
+                    # timed-out (possibly billed) requests are not re-sent
+                    max_retries=Retry(
+                        total=3,
+                        read=0,
+                        backoff_factor=0.5,
+                        status_forcelist=[500, 502, 503, 504],
+                        allowed_methods=["POST"],
+                        raise_on_status=False,
+                    ),
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                cls._sessions[base_url] = session
+
+                # Do the TCP/TLS handshake before the first prediction is needed
+                if prewarm:
+                    threading.Thread(
+                        target=cls._prewarm_session,
+                        args=(session, base_url),
+                        daemon=True,
+                    ).start()
+            return session
+
+    @staticmethod
+    def _prewarm_session(session: requests.Session, base_url: str) -> None:
+        """Open a pooled connection to the API with a lightweight HEAD request.
+
+        Parameters
+        ----------
+        session : requests.Session
+            The session whose connection pool should be warmed up.
+        base_url : str
+            Base URL of the LLM API.
+
+        """
+        try:
+            session.head(base_url, timeout=5)
+        except requests.RequestException as e:
+            logger.debug("Pre-warming connection to %s failed: %s", base_url, e)
 
-    def wait_for_rate_limit(self, request_duration: float) -> None:
-        """Calculate and wait for the appropriate time to respect rate limits.
+    @classmethod
+    def close_sessions(cls) -> None:
+        """Close all shared HTTP sessions and release their connections."""
+        with cls._sessions_lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions.clear()
+
+    @classmethod
+    def _get_rate_limiter(cls, provider: str, rate_limit: float) -> TokenBucket:
+        """Get (or create) the rate limiter for a provider.
 
         Parameters
         ----------
-        request_duration : float
-            The duration of the last request in seconds.
+        provider : str
+            The LLM provider name.
+        rate_limit : float
+            Allowed requests per minute.
+
+        Returns
+        -------
+        TokenBucket
+            The token bucket shared by all instances of this provider.
 
         """
-        # Calculate minimum time between requests (in s) with a small safety buffer
-        min_interval = (60.0 / self.rate_limit) * 1.1
+        with cls._rate_limiters_lock:
+            bucket = cls._rate_limiters.get(provider)
+            if bucket is None:
+                # Refill with a small safety buffer below the allowed rate
+                bucket = TokenBucket(rate_per_sec=rate_limit / 60.0 / 1.1)
+                cls._rate_limiters[provider] = bucket
+            return bucket
+
+    def _build_anthropic_payload(
+        self,
+        user_prompt: str,
+        llm_kwargs: Mapping[str, Any],
+    ) -> dict[str, Any]:
+        """Build the request payload for the Anthropic Messages API."""
+        return {
+            "model": self.model,
+            "system": self._system_prompt_json,
+            "messages": [
+                {"role": "user", "content": user_prompt},
+            ],
+            "stream": False,
+            **llm_kwargs,
+        }
+
+    def _build_google_payload(
+        self,
+        user_prompt: str,
+        llm_kwargs: Mapping[str, Any],
+    ) -> dict[str, Any]:
+        """Build the request payload for the Google Gemini API."""
+        return {
+            "contents": [{"parts": [{"text": user_prompt}]}],
+            "generationConfig": {**llm_kwargs},
+            "system_instruction": {"parts": {"text": self._system_prompt_json}},
+        }
+
+    def _build_openai_payload(
+        self,
+        user_prompt: str,
+        llm_kwargs: Mapping[str, Any],
+    ) -> dict[str, Any]:
+        """Build the request payload for OpenAI compatible chat completion APIs."""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self._system_prompt_json},
+                {"role": "user", "content": user_prompt},
+            ],
+            **llm_kwargs,
+        }
 
-        # If request took less time than minimum interval, sleep for the difference
-        if request_duration < min_interval:
-            sleep_duration = min_interval - request_duration
+    def _extract_path_prediction(self, full_response: dict[str, Any]) -> str:
+        """Extract the prediction by following the precompiled response path."""
+        value: Any = full_response
+        for key in self._response_path:
+            value = value[key]
+        return value
+
+    def _extract_google_prediction(self, full_response: dict[str, Any]) -> str:
+        """Extract the prediction from a Google Gemini API response."""
+        # Skip thought parts (present when thinkingConfig is used or omitted)
+        # and return the first non-thought part
+        parts = full_response["candidates"][0]["content"]["parts"]
+        prediction = next((p["text"] for p in parts if not p.get("thought")), None)
+        if prediction is None:
+            msg = f"No answer part in Google API response for {self.model}"
+            raise ValueError(msg)
+        return prediction
+
+    @staticmethod
+    def _log_rate_limit_status(response: requests.Response) -> None:
+        """Log the rate limit headers of a response (debug level), if present."""
+        rate_limit_headers = {
+            "remaining": response.headers.get("x-ratelimit-remaining")
+            or response.headers.get("x-ratelimit-requests-remaining"),
+            "limit": response.headers.get("x-ratelimit-limit")
+            or response.headers.get("x-ratelimit-requests-limit"),
+            "reset": response.headers.get("x-ratelimit-reset")
+            or response.headers.get("x-ratelimit-reset-requests"),
+        }
+        if any(rate_limit_headers.values()):
             logger.debug(
-                "Rate limiting: request took %s seconds, sleeping for %s seconds",
-                round(request_duration, 2),
-                round(sleep_duration, 2),
+                "Rate limit status: %s",
+                {k: v for k, v in rate_limit_headers.items() if v},
             )
-            time.sleep(sleep_duration)
 
-    def get_prediction(self, user_prompt: str, timeout: int = 60, **kwargs) -> str:
+    def _cache_key(self, user_prompt: str, llm_kwargs: Mapping[str, Any]) -> bytes:
+        """Hash everything that determines the response to a prompt.
+
+        The key covers the cache version, the provider and model, the (rendered)
+        system prompt, the user prompt and the LLM keyword arguments, so edits of
+        the prompt templates or the response schema invalidate cached responses.
+        """
+        request_identity = orjson.dumps(
+            [
+                LLM_CACHE_VERSION,
+                self.provider,
+                self.model,
+                self.prediction_type,
+                self._system_prompt_digest,
+                user_prompt,
+                llm_kwargs,
+            ],
+            default=dict,  # read-only default kwargs (MappingProxyType)
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.blake2b(request_identity, digest_size=16).digest()
+
+    def _get_cached_prediction(self, cache_key: bytes) -> str | None:
+        """Look up a prediction in the in-memory cache, then in the persistent one."""
+        if self.cache:
+            cached_prediction = self.cache.get(cache_key)
+            if cached_prediction is not None:
+                return cached_prediction
+        if self.response_cache:
+            cached_prediction = self.response_cache.get(cache_key)
+            if cached_prediction is not None and self.cache:
+                self.cache.put(cache_key, cached_prediction)
+            return cached_prediction
+        return None
+
+    def _put_cached_prediction(self, cache_key: bytes, prediction: str) -> None:
+        """Store a prediction in the in-memory and the persistent cache."""
+        if self.cache:
+            self.cache.put(cache_key, prediction)
+        if self.response_cache:
+            self.response_cache.put(cache_key, prediction)
+
+    def cache_prediction(self, user_prompt: str, prediction: str, **kwargs) -> None:
+        """Cache a prediction that the caller has validated.
+
+        The prediction is stored in the in-memory and the persistent cache.
+        Predictions are not cached by ``get_prediction`` itself, so that retries
+        after a malformed or rejected answer send a new request (and later runs
+        do not replay it).
+
+        Parameters
+        ----------
+        user_prompt : str
+            The prompt the prediction was returned for.
+        prediction : str
+            The (validated) prediction from the LLM.
+        **kwargs : dict, optional
+            The keyword arguments passed to ``get_prediction`` for the prompt.
+
+        """
+        if not (self.cache or self.response_cache):
+            return
+        llm_kwargs = {**self.kwargs, **kwargs} if kwargs else self.kwargs
+        self._put_cached_prediction(
+            self._cache_key(user_prompt, llm_kwargs), prediction
+        )
+
+    def get_prediction(
+        self,
+        user_prompt: str,
+        timeout: int = 60,
+        *,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> str:
         """Get the prediction from the LLM.
 
         Parameters
@@ -154,6 +638,9 @@ class LLMManager:
             The prompt to send to the LLM.
         timeout : int, optional
             Timeout for in seconds, by default 60 (sufficient for most LLMs).
+        use_cache : bool, optional
+            Whether to return a cached prediction if available, by default True
+            (disable for retries, so a new answer is requested).
         **kwargs : dict, optional
             Additional keyword arguments to pass to the LLM (override defaults).
 
@@ -166,68 +653,35 @@ class LLMManager:
         ------
         requests.RequestException
             If there's an error in getting the prediction from the LLM.
+        orjson.JSONDecodeError
+            If the response body is not valid JSON.
 
         """
+        # Only build the (non-trivial) debug log arguments if they are emitted
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         logger.debug("Getting prediction for prompt: %.50s...", user_prompt)
 
-        # Record start time
-        start_time = time.time()
-
-        # Get kwargs, give priority to kwargs passed to the function
-        llm_kwargs = {**self.kwargs, **kwargs}
-
-        headers = {
-            "content-type": "application/json",
-        }
-
-        # For Anthropic Claude, we need to structure the request differently
-        if self.provider.startswith("anthropic"):
-            url = f"{self.base_url}/{self.operation}"
-            headers["x-api-key"] = self.api_key
-            headers["anthropic-version"] = "2023-06-01"
-
-            # Add optional headers if specified
-            headers.update(self.optional_headers)
+        # Get kwargs, give priority to kwargs passed to the function (the read-only
+        # defaults are used as they are if nothing is overridden)
+        llm_kwargs = {**self.kwargs, **kwargs} if kwargs else self.kwargs
 
-            data = {
-                "model": self.model,
-                "system": self.system_prompt,
-                "messages": [
-                    {"role": "user", "content": user_prompt},
-                ],
-                "stream": False,
-                **llm_kwargs,
-            }
-        # For Google Gemini API, we need to structure the request differently
-        elif self.provider.startswith("google"):
-            url = f"{self.base_url}/models/{self.model}:{self.operation}"
-            headers["x-goog-api-key"] = self.api_key
-
-            # Add optional headers if specified
-            headers.update(self.optional_headers)
-
-            data = {
-                "contents": [{"parts": [{"text": user_prompt}]}],
-                "generationConfig": {**llm_kwargs},
-                "system_instruction": {"parts": {"text": self.system_prompt}},
-            }
+        # Return a cached prediction for an identical request if available
+        if use_cache and (self.cache or self.response_cache):
+            cache_key = self._cache_key(user_prompt, llm_kwargs)
+            cached_prediction = self._get_cached_prediction(cache_key)
+            if cached_prediction is not None:
+                logger.debug("Returning cached prediction: %.50s...", cached_prediction)
+                return cached_prediction
 
-        # OpenAI and compatible: Mistral, OpenRouter, etc.
-        else:
-            url = f"{self.base_url}/{self.operation}"
-            headers["authorization"] = f"Bearer {self.api_key}"
+        # Observe a rate limit if specified (shared by all instances of a provider)
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
 
-            # Add optional headers if specified (e.g., for OpenRouter)
-            headers.update(self.optional_headers)
+        # Record start time
+        start_time = time.time()
 
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                **llm_kwargs,
-            }
+        url = self._url
+        data = self._build_payload(user_prompt, llm_kwargs)
 
         # Pre-request debug logging
         logger.debug(
@@ -239,32 +693,33 @@ class LLMManager:
         )
 
         # Log sanitized request payload structure (avoid logging sensitive data)
-        sanitized_data = {
-            "model": data.get("model"),
-            "message_count": len(data.get("messages", []))
-            if "messages" in data
-            else len(data.get("contents", [])),
-            "temperature": data.get("temperature")
-            or data.get("generationConfig", {}).get("temperature"),
-            "max_tokens": (
-                data.get("max_tokens")
-                or data.get("max_completion_tokens")
-                or data.get("generationConfig", {}).get("maxOutputTokens")
-            ),
-            "stream": data.get("stream"),
-            "response_format": bool(
-                data.get("response_format")
-                or data.get("generationConfig", {}).get("response_mime_type")
-            ),
-        }
-        logger.debug("Request payload structure: %s", sanitized_data)
+        if debug_enabled:
+            sanitized_data = {
+                "model": data.get("model"),
+                "message_count": len(data.get("messages", []))
+                if "messages" in data
+                else len(data.get("contents", [])),
+                "temperature": data.get("temperature")
+                or data.get("generationConfig", {}).get("temperature"),
+                "max_tokens": (
+                    data.get("max_tokens")
+                    or data.get("max_completion_tokens")
+                    or data.get("generationConfig", {}).get("maxOutputTokens")
+                ),
+                "stream": data.get("stream"),
+                "response_format": bool(
+                    data.get("response_format")
+                    or data.get("generationConfig", {}).get("response_mime_type")
+                ),
+            }
+            logger.debug("Request payload structure: %s", sanitized_data)
 
         try:
             # Send the prompt to the LLM to receive the full response
-            response = requests.post(
+            response = self.session.post(
                 url=url,
-                headers=headers,
-                json=data,
+                headers=self._headers,
+                data=orjson.dumps(data),
                 timeout=timeout,
             )
 
@@ -273,48 +728,40 @@ class LLMManager:
             logger.debug("LLM request completed in %.2f seconds", elapsed_time)
 
             # Log rate limit information if available
-            rate_limit_headers = {
-                "remaining": response.headers.get("x-ratelimit-remaining")
-                or response.headers.get("x-ratelimit-requests-remaining"),
-                "limit": response.headers.get("x-ratelimit-limit")
-                or response.headers.get("x-ratelimit-requests-limit"),
-                "reset": response.headers.get("x-ratelimit-reset")
-                or response.headers.get("x-ratelimit-reset-requests"),
-            }
-            if any(rate_limit_headers.values()):
-                logger.debug(
-                    "Rate limit status: %s",
-                    {k: v for k, v in rate_limit_headers.items() if v},
-                )
+            if debug_enabled:
+                self._log_rate_limit_status(response)
 
             # Check the response and raise an exception if it's not successful
             response.raise_for_status()
 
             # Parse the response
-            full_response = response.json()
-            self.full_response_list.append(full_response)
+            full_response = orjson.loads(response.content)
 
             # Get the prediction
-            if self.provider.startswith("anthropic"):
-                prediction = full_response["content"][0]["text"]
-            elif self.provider.startswith("google"):
-                # Skip thought parts (present when thinkingConfig is used or omitted)
-                # and return the first non-thought part
-                parts = full_response["candidates"][0]["content"]["parts"]
-                prediction = next(
-                    (p["text"] for p in parts if not p.get("thought")), None
+            prediction = self._extract_prediction(full_response)
+
+            # Keep a trimmed copy of the response in the (bounded) history
+            if self.full_response_list is not None:
+                self.full_response_list.append(
+                    {
+                        "prediction": prediction,
+                        "model": full_response.get("model", self.model),
+                        "usage": full_response.get("usage")
+                        or full_response.get("usageMetadata"),
+                    },
                 )
-                if prediction is None:
-                    msg = f"No answer part in Google API response for {self.model}"
-                    raise ValueError(msg)
-            else:
-                prediction = full_response["choices"][0]["message"]["content"]
-
-            # Observe a rate limit if specified
-            if self.rate_limit > 0:  # Check for rate limit
-                self.wait_for_rate_limit(request_duration=time.time() - start_time)
 
         except requests.HTTPError as e:
+            # Block the provider's rate limiter for as long as the API asks us to
+            if (
+                self.rate_limiter
+                and e.response is not None
+                and e.response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+            ):
+                retry_after = e.response.headers.get("retry-after", "")
+                if retry_after.isdigit():
+                    self.rate_limiter.drain(float(retry_after))
+
             # Capture detailed error information from the API response
             elapsed_time = time.time() - start_time
             error_details = {
@@ -349,8 +796,9 @@ class LLMManager:
 
             logger.error("LLM API request failed: %s", error_details)
             raise
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             # Handle other request exceptions (timeouts, connection errors, etc.)
+            # and response bodies that are not valid JSON
             elapsed_time = time.time() - start_time
             error_details = {
                 "provider": self.provider,
@@ -366,3 +814,51 @@ class LLMManager:
         else:
             logger.debug("Received prediction: %.50s...", prediction)
             return prediction
+
+    def get_predictions_batch(
+        self,
+        user_prompts: list[str],
+        max_concurrency: int = 4,
+        timeout: int = 60,
+        **kwargs,
+    ) -> list[str]:
+        """Get predictions for several prompts concurrently.
+
+        Requests are I/O bound, so they are fanned out over a small thread pool
+        sharing the pooled HTTP session.
+
+        Parameters
+        ----------
+        user_prompts : list[str]
+            The prompts to send to the LLM.
+        max_concurrency : int, optional
+            Maximum number of requests in flight, by default 4. Requests still
+            respect the provider's shared rate limiter.
+        timeout : int, optional
+            Timeout for in seconds per request, by default 60.
+        **kwargs : dict, optional
+            Additional keyword arguments to pass to the LLM (override defaults).
+
+        Returns
+        -------
+        list[str]
+            The predictions from the LLM, in the order of the prompts.
+
+        Raises
+        ------
+        requests.RequestException
+            If there's an error in getting any of the predictions from the LLM.
+
+        """
+        if not user_prompts:
+            return []
+
+        workers = min(max(1, max_concurrency), len(user_prompts))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda prompt: self.get_prediction(prompt, timeout, **kwargs),
+                    user_prompts,
+                ),
+            )
@@ -4,6 +4,8 @@
 # * Creation : Nov 2024
 # * License: MIT license
 
+from typing import ClassVar
+
 # %% --------------------------------------------
 # * Class Definitions
 
@@ -52,11 +54,19 @@ class Prompt:
     "Considering the momentums, I am confident that Manchester will win this.",
     "In this historical derby, there will be no winner.")
     Response Format (JSON):
-    "{{'reasoning': 'REASONING',
-    'prediction': {{'home': 2, 'away': 0}},
-    'outlook': 'SHORT_ONELINER'}}"
+    {{"reasoning": "REASONING",
+    "prediction": {{"home": 2, "away": 0}},
+    "outlook": "SHORT_ONELINER"}}
     """
 
+    # Rendered system prompts per prompt type (formatted once at class creation)
+    _RENDERED: ClassVar[dict[str, str]] = {
+        "Default": PREDICTION_PROMPT.format(scoring_rules=DEFAULT_SCORING_PROMPT),
+        "FourPointsScoring": PREDICTION_PROMPT.format(
+            scoring_rules=FOUR_POINTS_SCORING_PROMPT,
+        ),
+    }
+
     @classmethod
     def get(cls, prompt_type: str = "Default") -> str:
         """Get the system prompt for the specified type.
@@ -77,14 +87,8 @@ class Prompt:
             If an invalid prompt type is provided.
 
         """
-        scoring_prompts = {
-            "Default": cls.DEFAULT_SCORING_PROMPT,
-            "FourPointsScoring": cls.FOUR_POINTS_SCORING_PROMPT,
-        }
-
-        scoring_prompt = scoring_prompts.get(prompt_type)
-        if scoring_prompt is None:
+        try:
+            return cls._RENDERED[prompt_type]
+        except KeyError:
             error_message = f"Invalid prompt type: {prompt_type}"
-            raise ValueError(error_message)
-
-        return cls.PREDICTION_PROMPT.format(scoring_rules=scoring_prompt)
+            raise ValueError(error_message) from None
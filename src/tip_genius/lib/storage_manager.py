@@ -5,19 +5,31 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import orjson
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config_loader import load_yaml_config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+VERCEL_CONFIG_FILE = Path(__file__).parents[1] / "cfg" / "vercel_config.yaml"
+FILE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
 # %% --------------------------------------------
 # * Class Definitions
 
@@ -43,9 +55,24 @@ class StorageManager:
     ----------
     kv_initialized : bool
         Indicates whether KV storage is properly configured and available
+    session : requests.Session
+        Keep-alive HTTP session used for the KV requests
 
     """
 
+    __slots__ = (
+        "_io_pool",
+        "_writers",
+        "debug",
+        "export_to_file",
+        "kv_initialized",
+        "kv_token",
+        "kv_url",
+        "match_predictions_folder",
+        "session",
+        "write_to_kv",
+    )
+
     def __init__(
         self,
         match_predictions_folder: str,
@@ -66,6 +93,58 @@ class StorageManager:
         # Initialize environment configuration
         self.kv_initialized = self._initialize_kv_config()
 
+        # Keep-alive HTTP session for KV requests (auth headers set once)
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=4,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=["POST"],  # KV SETs are idempotent
+                    raise_on_status=False,
+                ),
+            ),
+        )
+        if self.kv_initialized:
+            self.session.headers.update(
+                {
+                    "Authorization": f"Bearer {self.kv_token}",
+                    "Content-Type": "application/json",
+                },
+            )
+
+        # Output plan, fixed after init (store_predictions just runs each writer)
+        self._writers: list[Callable[[list[bytes], str, str, str | None], bool]] = []
+        if self.export_to_file:
+            self._writers.append(self._write_files)
+        if self.write_to_kv:
+            self._writers.append(
+                self._write_kv if self.kv_initialized else self._kv_unavailable,
+            )
+        # Overlap disk and network I/O if more than one output is enabled
+        self._io_pool = (
+            ThreadPoolExecutor(
+                max_workers=len(self._writers),
+                thread_name_prefix="storage",
+            )
+            if len(self._writers) > 1
+            else None
+        )
+
+    def close(self) -> None:
+        """Release the HTTP connections and the I/O worker threads.
+
+        Later exports on the same instance still work, writing sequentially.
+        """
+        self.session.close()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+
     def _initialize_kv_config(self) -> bool:
         """Initialize Vercel KV configuration from config file and env variables.
 
@@ -81,10 +160,8 @@ class StorageManager:
 
         """
         try:
-            # Load KV config
-            config_path = Path(__file__).parents[1] / "cfg" / "vercel_config.yaml"
-            with config_path.open(encoding="utf-8") as f:
-                config = yaml.safe_load(f)["tip_genius"]
+            # Load KV config (parsed once per process, see config_loader)
+            config = load_yaml_config(VERCEL_CONFIG_FILE)["tip_genius"]
 
             # Get environment variables from .env.local or system environment
             self.kv_token = os.environ[config["kv_token_env_name"]]
@@ -126,61 +203,141 @@ class StorageManager:
             True if all operations were successful, False if any failed
 
         """
-        # Generate timestamp
-        timestamp = datetime.now(tz=UTC).strftime("%Y-%m-%d_%H-%M-%S")
-        all_successful = True
-
-        # Generate filenames
-        timestamped_filename = f"{timestamp}_{base_key}.jsonl"
-        non_timestamped_filename = f"{base_key}.jsonl"
-        # Store files locally if enabled
-        if self.export_to_file:
-            if full_export_path:
-                # Create directory if it doesn't exist
-                export_path = Path(full_export_path)
-                export_path.mkdir(parents=True, exist_ok=True)
-                file_result1 = self._store_to_file(
-                    prediction_data=prediction_data,
-                    file_path=export_path / timestamped_filename,
-                )
-                file_result2 = self._store_to_file(
-                    prediction_data=prediction_data,
-                    file_path=export_path / non_timestamped_filename,
-                )
-                all_successful = all_successful and file_result1 and file_result2
-            else:
-                logger.warning(
-                    "Full export path not provided, predictions not stored locally.",
-                )
-                all_successful = False
-        # Store in KV if enabled
-        if self.write_to_kv:
-            if self.kv_initialized:
-                # Store both timestamped and non-timestamped versions
-                kv_result1 = self._store_to_kv(
-                    prediction_data,
-                    f"{timestamp}_{base_key}",
+        # Generate timestamps once, so all outputs of this export are consistent
+        now = datetime.now(tz=UTC)
+        timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp_human = now.strftime("%Y-%m-%d %H:%M:%S")
+
+        # Serialize each league once, the bytes are reused for files and KV.
+        # Records are assembled from bytes, equal to the compact JSON encoding of
+        # {"name": sport, "timestamp": timestamp_human, "matches": matches}
+        timestamp_part = b',"timestamp":' + orjson.dumps(timestamp_human)
+        records = []
+        for sport, matches in prediction_data.items():
+            sport_json = orjson.dumps(sport)
+            matches_json = orjson.dumps(matches)
+            records.append(
+                b'{"name":%b%b,"matches":%b}'
+                % (sport_json, timestamp_part, matches_json),
+            )
+
+        # Run every writer (no short-circuit, a failed output must not skip others)
+        if self._io_pool is not None:
+            futures = [
+                self._io_pool.submit(
+                    writer, records, base_key, timestamp, full_export_path
                 )
-                kv_result2 = self._store_to_kv(prediction_data, base_key)
-                all_successful = all_successful and kv_result1 and kv_result2
-            else:
-                logger.warning("Vercel KV not configured, predictions not stored.")
-                all_successful = False
+                for writer in self._writers
+            ]
+            results = [future.result() for future in futures]
+        else:
+            results = [
+                writer(records, base_key, timestamp, full_export_path)
+                for writer in self._writers
+            ]
+        return all(results)
+
+    def _write_files(
+        self,
+        records: list[bytes],
+        base_key: str,
+        timestamp: str,
+        full_export_path: str | None,
+    ) -> bool:
+        """Write the timestamped and the latest JSONL export files.
+
+        Parameters
+        ----------
+        records : list[bytes]
+            The serialized predictions (one JSON object per league)
+        base_key : str
+            Base name of the export files
+        timestamp : str
+            Timestamp prefix of the timestamped file
+        full_export_path : str, optional
+            Full path to the export directory
+
+        Returns
+        -------
+        bool
+            True if both files were written successfully, False otherwise
+
+        """
+        if not full_export_path:
+            logger.warning(
+                "Full export path not provided, predictions not stored locally.",
+            )
+            return False
+
+        # Create directory if it doesn't exist
+        export_path = Path(full_export_path)
+        export_path.mkdir(parents=True, exist_ok=True)
+        timestamped_path = export_path / f"{timestamp}_{base_key}.jsonl"
+        # Same content: link the latest file instead of writing it twice
+        return self._store_to_file(
+            records=records,
+            file_path=timestamped_path,
+        ) and self._link_file(
+            source_path=timestamped_path,
+            target_path=export_path / f"{base_key}.jsonl",
+        )
+
+    def _write_kv(
+        self,
+        records: list[bytes],
+        base_key: str,
+        timestamp: str,
+        _full_export_path: str | None,
+    ) -> bool:
+        """Write the timestamped and the latest key to Vercel KV (one request).
+
+        Parameters
+        ----------
+        records : list[bytes]
+            The serialized predictions (one JSON object per league)
+        base_key : str
+            Base key name
+        timestamp : str
+            Timestamp prefix of the timestamped key
+        _full_export_path : str, optional
+            Unused, part of the common writer signature
+
+        Returns
+        -------
+        bool
+            True if the KV write was successful, False otherwise
+
+        """
+        return self._store_to_kv(
+            payload=b"[%b]" % b",".join(records),
+            key_names=[f"{timestamp}_{base_key}", base_key],
+        )
+
+    def _kv_unavailable(self, *_args: object) -> bool:
+        """Report that KV output is enabled but not configured.
+
+        Returns
+        -------
+        bool
+            Always False
 
-        return all_successful
+        """
+        logger.warning("Vercel KV not configured, predictions not stored.")
+        return False
 
     def _store_to_file(
         self,
-        prediction_data: dict[str, list[dict[str, Any]]],
-        file_path: str | Path,
+        records: Iterable[bytes],
+        file_path: Path,
     ) -> bool:
         """Store predictions to a JSONL file.
 
         Parameters
         ----------
-        prediction_data : dict[str, dict[str, list[dict[str, Any]]]]
-            The prediction data to store
-        file_path : str
+        records : Iterable[bytes]
+            The serialized predictions (one JSON object per league), written
+            record by record as separate lines
+        file_path : Path
             Full path to the export file
 
         Returns
@@ -189,79 +346,121 @@ class StorageManager:
             True if storage was successful, False otherwise
 
         """
+        # Write to a temporary file and rename it, readers never see a partial file
+        tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
         try:
-            file_path = Path(file_path)
-            with file_path.open("w", encoding="utf-8") as f:
-                for sport, matches in prediction_data.items():
-                    timestamp = datetime.now(tz=UTC).strftime(
-                        "%Y-%m-%d %H:%M:%S",
-                    )
-                    json.dump(
-                        {"name": sport, "timestamp": timestamp, "matches": matches},
-                        f,
-                        ensure_ascii=False,
-                    )
-                    f.write("\n")
+            # Large buffer: records are small, avoid a write syscall per line
+            with tmp_path.open("wb", buffering=FILE_BUFFER_SIZE) as f:
+                for record in records:
+                    f.write(record)
+                    f.write(b"\n")
+                f.flush()
+                getattr(os, "fdatasync", os.fsync)(f.fileno())
+                # Write-once file: drop its (now clean) pages from the page cache
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            tmp_path.replace(file_path)
 
         except OSError:
             logger.exception(
                 "Failed to write predictions to file %s",
                 file_path,
             )
+            tmp_path.unlink(missing_ok=True)
             return False
 
         else:
             logger.debug("Successfully exported predictions to: %s", file_path)
             return True
 
+    def _link_file(self, source_path: Path, target_path: Path) -> bool:
+        """Atomically replace a file by a hard link to (or copy of) another file.
+
+        Parameters
+        ----------
+        source_path : Path
+            Path to the existing file
+        target_path : Path
+            Path of the file to create or replace
+
+        Returns
+        -------
+        bool
+            True if the file was linked (or copied) successfully, False otherwise
+
+        """
+        tmp_path = target_path.with_name(f".{target_path.name}.tmp")
+        try:
+            tmp_path.unlink(missing_ok=True)
+            try:
+                tmp_path.hardlink_to(source_path)
+            except OSError:  # e.g. file system without hard link support
+                shutil.copyfile(source_path, tmp_path)
+            tmp_path.replace(target_path)
+
+        except OSError:
+            logger.exception(
+                "Failed to link predictions file %s to %s",
+                target_path,
+                source_path,
+            )
+            return False
+
+        else:
+            logger.debug("Successfully exported predictions to: %s", target_path)
+            return True
+
     def _store_to_kv(
         self,
-        prediction_data: dict[str, list[dict[str, Any]]],
-        key_name: str,
+        payload: bytes,
+        key_names: list[str],
     ) -> bool:
-        """Store predictions in Vercel KV.
+        """Store predictions in Vercel KV under one or more keys.
+
+        All keys are written with a single pipelined request.
 
         Parameters
         ----------
-        prediction_data : dict[str, dict[str, list[dict[str, Any]]]]
-            The prediction data to store
-        key_name : str
-            The key name to use in KV storage
+        payload : bytes
+            The serialized predictions (JSON list of league data)
+        key_names : list[str]
+            The key names to use in KV storage
 
         Returns
         -------
         bool
-            True if storage was successful, False otherwise
+            True if storage was successful for all keys, False otherwise
 
         """
         if not self.kv_initialized or not self.kv_url or not self.kv_token:
             return False
 
-        headers = {
-            "Authorization": f"Bearer {self.kv_token}",
-            "Content-Type": "application/json",
-        }
-
         try:
-            timestamp = datetime.now(tz=UTC).strftime("%Y-%m-%d %H:%M:%S")
-            # Convert data to KV format (list of league data)
-            kv_data = [
-                {"name": sport, "timestamp": timestamp, "matches": matches}
-                for sport, matches in prediction_data.items()
-            ]
-
-            # Store in KV using the provided key - use request body instead of URL path
-            response = requests.post(
-                f"{self.kv_url}/set/{key_name}",
-                headers=headers,
-                json=kv_data,  # Use json parameter instead of including in URL
+            # Set all keys in one round trip using the REST pipeline endpoint.
+            # The value is JSON-escaped once and embedded as-is in every command
+            value = orjson.Fragment(orjson.dumps(payload.decode()))
+            response = self.session.post(
+                f"{self.kv_url}/pipeline",
+                data=orjson.dumps([["SET", key, value] for key in key_names]),
                 timeout=10,
             )
 
             if response.status_code == 200:
+                # The pipeline returns one result (or error) per command
+                errors = {
+                    key: result["error"]
+                    for key, result in zip(key_names, response.json(), strict=True)
+                    if "error" in result
+                }
+                if errors:
+                    logger.error(
+                        "Failed to write predictions in Vercel KV: %s",
+                        errors,
+                    )
+                    return False
                 logger.debug(
-                    "Successfully stored predictions in Vercel KV with key: %s",
-                    key_name,
+                    "Successfully stored predictions in Vercel KV with keys: %s",
+                    key_names,
                 )
                 return True
             logger.exception(
@@ -6,15 +6,45 @@
 # %% --------------------------------------------
 # * Libraries
 import logging
+import re
+from bisect import bisect_left, bisect_right
 from difflib import get_close_matches
-from functools import cache
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 from slugify import slugify
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Fast path of slugify(name, separator="_") for plain ASCII names
+_NUMBER_SEPARATOR = re.compile(r"(?<=\d),(?=\d)")
+_DISALLOWED_CHARS = re.compile(r"[^a-z0-9]+")
+
+# %% --------------------------------------------
+# * Functions
+
+
+@lru_cache(maxsize=32)
+def _list_logo_names(directory: Path, mtime_ns: int) -> tuple[str, ...]:  # noqa: ARG001
+    """List the PNG file names (without extension), cached by directory mtime."""
+    return tuple(f.stem for f in directory.glob("*.png"))
+
+
+@lru_cache(maxsize=4096)
+def _slugify_name(name: str) -> str:
+    """Slugify a name with "_" as separator, same output as slugify.
+
+    Plain ASCII names without HTML entities skip the transliteration and entity
+    decoding steps of slugify, all other names are passed on to slugify.
+    """
+    if name.isascii() and "&" not in name:
+        name = _NUMBER_SEPARATOR.sub("", name.lower())
+        return _DISALLOWED_CHARS.sub("_", name).strip("_")
+    return slugify(name, separator="_")
+
+
 # %% --------------------------------------------
 # * Class Definitions
 
@@ -31,6 +61,9 @@ class TeamLogoMatcher:
         Path to the directory containing team logo files
     match_cutoff : float, optional
         Minimum similarity ratio (0.0-1.0) to consider a match valid, by default 0.6
+    cache_file : str or Path, optional
+        JSON file to persist the match results across runs (see ``save_cache``),
+        by default None (results are only cached in memory)
 
     Attributes
     ----------
@@ -43,12 +76,30 @@ class TeamLogoMatcher:
 
     """
 
-    def __init__(self, logo_directory: str | Path, match_cutoff: float = 0.6) -> None:
+    def __init__(
+        self,
+        logo_directory: str | Path,
+        match_cutoff: float = 0.6,
+        cache_file: str | Path | None = None,
+    ) -> None:
         """Initialize the TeamLogoMatcher with a directory path and cutoff."""
         self.logo_directory = Path(logo_directory)
         self.match_cutoff = match_cutoff
         self.logo_files: list[str] = []
+        self._name_mapping: dict[str, str] = {}
+        self._processed_names: list[str] = []
+        self._name_lengths: list[int] = []
         self._loadlogo_files()
+
+        # Match results (persisted if a cache file is set), only valid for the
+        # same logos and cutoff
+        self.cache_file = Path(cache_file) if cache_file else None
+        self._cache_stamp = (
+            f"{self._directory_mtime_ns}_{len(self.logo_files)}_{self.match_cutoff}"
+        )
+        self._match_cache: dict[str, str | None] = {}
+        self._cache_modified = False
+        self._load_cache()
         logger.info(
             "TeamLogoMatcher initialized with %d logo files",
             len(self.logo_files),
@@ -58,7 +109,8 @@ class TeamLogoMatcher:
         """Load and cache the list of logo files from the directory.
 
         This method reads all PNG files from the logo directory and stores their
-        names without extensions for matching.
+        names without extensions, together with their preprocessed names used
+        for matching.
 
         Raises
         ------
@@ -67,9 +119,19 @@ class TeamLogoMatcher:
 
         """
         try:
-            self.logo_files = [f.stem for f in self.logo_directory.glob("*.png")]
+            # Directory listing is reused until files are added, removed or renamed
+            self._directory_mtime_ns = self.logo_directory.stat().st_mtime_ns
+            self.logo_files = list(
+                _list_logo_names(self.logo_directory, self._directory_mtime_ns),
+            )
             logger.debug("Loading logo files from directory: %s", self.logo_directory)
 
+            # Preprocess the logo names once (not on every lookup)
+            self._name_mapping = {self.preprocess_name(f): f for f in self.logo_files}
+            # Sorted by length, for selecting candidates by length (see find_logo)
+            self._processed_names = sorted(self._name_mapping, key=len)
+            self._name_lengths = [len(name) for name in self._processed_names]
+
             if not self.logo_files:
                 logger.warning(
                     "No PNG files found in logo directory: %s",
@@ -80,6 +142,39 @@ class TeamLogoMatcher:
             logger.exception("Logo directory not found: %s", self.logo_directory)
             raise
 
+    def _load_cache(self) -> None:
+        """Load the persisted match results, if they match the current logos."""
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+        try:
+            cache = orjson.loads(self.cache_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            logger.warning("Ignoring unreadable logo match cache: %s", self.cache_file)
+            return
+
+        if cache.get("stamp") == self._cache_stamp:
+            self._match_cache = cache.get("matches", {})
+            logger.debug(
+                "Loaded %d cached logo matches from %s",
+                len(self._match_cache),
+                self.cache_file,
+            )
+
+    def save_cache(self) -> None:
+        """Persist the match results to the cache file (if set and modified)."""
+        if self.cache_file is None or not self._cache_modified:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_bytes(
+                orjson.dumps(
+                    {"stamp": self._cache_stamp, "matches": self._match_cache},
+                ),
+            )
+            self._cache_modified = False
+        except OSError:
+            logger.warning("Failed to write logo match cache: %s", self.cache_file)
+
     def preprocess_name(self, name: str) -> str:
         """Preprocess a team name for better matching.
 
@@ -94,9 +189,8 @@ class TeamLogoMatcher:
             Preprocessed team name using slugify for consistent processing
 
         """
-        return slugify(name, separator="_")
+        return _slugify_name(name)
 
-    @cache  # noqa: B019
     def find_logo(self, team_name: str) -> str | None:
         """Find the most likely matching logo file for a team name.
 
@@ -119,14 +213,15 @@ class TeamLogoMatcher:
             )
             return None
 
-        # Create a mapping of processed names to original filenames
-        name_mapping = {self.preprocess_name(f): f for f in self.logo_files}
+        # Match results of earlier lookups (and previous runs)
+        if team_name in self._match_cache:
+            return self._match_cache[team_name]
 
         # Find best match using processed names
         processed_name = self.preprocess_name(team_name)
         matches = get_close_matches(
             processed_name,
-            list(name_mapping.keys()),
+            self._length_candidates(len(processed_name)),
             n=5,
             cutoff=self.match_cutoff,
         )
@@ -137,10 +232,11 @@ class TeamLogoMatcher:
                 team_name,
                 processed_name,
             )
+            self._remember(team_name, None)
             return None
 
         # Get original filename directly from mapping
-        best_match = name_mapping[matches[0]]
+        best_match = self._name_mapping[matches[0]]
         best_match_logo = f"{best_match}.png"
         logger.debug(
             "Found logo match for '%s': %s (similarity matches: %s)",
@@ -149,4 +245,38 @@ class TeamLogoMatcher:
             matches,
         )
 
+        self._remember(team_name, best_match_logo)
         return best_match_logo
+
+    def _length_candidates(self, length: int) -> list[str]:
+        """Select the processed logo names that can reach the match cutoff.
+
+        The difflib similarity ratio is at most 2 * min(a, b) / (a + b) for names
+        of length a and b, so names outside the length range below can never
+        reach the cutoff and are skipped (the match result is unchanged).
+
+        Parameters
+        ----------
+        length : int
+            Length of the processed team name
+
+        Returns
+        -------
+        list[str]
+            Processed logo names with a suitable length
+
+        """
+        cutoff = self.match_cutoff
+        if cutoff <= 0:
+            return self._processed_names
+        # Small margin: borderline candidates are left to difflib's exact check
+        lower = length * cutoff / (2 - cutoff) - 1e-9
+        upper = length * (2 - cutoff) / cutoff + 1e-9
+        start = bisect_left(self._name_lengths, lower)
+        stop = bisect_right(self._name_lengths, upper)
+        return self._processed_names[start:stop]
+
+    def _remember(self, team_name: str, logo: str | None) -> None:
+        """Store a match result for later lookups (and ``save_cache``)."""
+        self._match_cache[team_name] = logo
+        self._cache_modified = self.cache_file is not None
@@ -7,18 +7,24 @@
 # %% --------------------------------------------
 # * Libraries
 
-import json
+import atexit
+import gzip
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 import time
 from ast import literal_eval
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from itertools import product
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+import orjson
 import polars as pl
 import yaml
 from lib.api_data import BaseAPI, OddsAPI
@@ -26,6 +32,9 @@ from lib.llm_manager import LLMManager
 from lib.storage_manager import StorageManager
 from lib.team_matching import TeamLogoMatcher
 
+# Project root (resolved once, independent of the working directory)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -62,6 +71,97 @@ def is_cloud_environment() -> bool:
     return any(indicator in os.environ for indicator in cloud_indicators)
 
 
+def parse_prediction(prediction: str) -> dict[str, Any]:
+    """Parse the LLM prediction (a JSON dict) into a Python dict.
+
+    Responses are parsed as JSON, Python literals (e.g. single quoted dicts of
+    models without a JSON mode) are accepted as a fallback.
+
+    Parameters
+    ----------
+    prediction : str
+        The raw prediction text returned by the LLM.
+
+    Returns
+    -------
+    dict[str, Any]
+        The parsed prediction.
+
+    """
+    try:
+        return orjson.loads(prediction)
+    except orjson.JSONDecodeError:
+        return literal_eval(prediction)
+
+
+def is_prediction_consistent(
+    p_home: float,
+    p_away: float,
+    o_home: float,
+    o_away: float,
+) -> bool:
+    """Check whether the predicted winner is in line with the odds.
+
+    A prediction is inconsistent if it picks the team with the higher (or equal)
+    odds as the winner, draws are always consistent.
+
+    Parameters
+    ----------
+    p_home : float
+        The predicted home score.
+    p_away : float
+        The predicted away score.
+    o_home : float
+        The home odds.
+    o_away : float
+        The away odds.
+
+    Returns
+    -------
+    bool
+        True if the prediction is consistent with the odds, False otherwise.
+
+    """
+    if p_home > p_away:
+        return o_home < o_away
+    if p_home < p_away:
+        return o_home > o_away
+    return True
+
+
+def is_prediction_valid(
+    reasoning: object,
+    outlook: object,
+    p_home: object,
+    p_away: object,
+) -> bool:
+    """Check whether the fields of a parsed prediction are usable.
+
+    Parameters
+    ----------
+    reasoning : object
+        The reasoning of the prediction.
+    outlook : object
+        The outlook of the prediction.
+    p_home : object
+        The predicted home score.
+    p_away : object
+        The predicted away score.
+
+    Returns
+    -------
+    bool
+        True if reasoning and outlook are given and both scores are ints.
+
+    """
+    return (
+        bool(reasoning)
+        and bool(outlook)
+        and isinstance(p_home, int)
+        and isinstance(p_away, int)
+    )
+
+
 # %% --------------------------------------------
 # * TipGenius Class Definition
 
@@ -89,12 +189,18 @@ class TipGenius:
         Flag to store intermediate LLM results to file system.
     llm_attempts : int, default 4
         Number of attempts for LLM predictions before giving up.
+    llm_concurrency : int, default 4
+        Maximum number of concurrent LLM requests (rows) per combination.
+    combination_concurrency : int, default 4
+        Maximum number of combinations processed concurrently.
     api_data_folder : str, default 'data/api_result'
         The folder path for storing API data.
     llm_data_folder : str, default 'data/llm_data'
         The folder path for storing LLM data.
     match_predictions_folder : str, default 'data/match_predictions'
         The folder path for storing prediction JSON and JSONL files.
+    logo_match_cache_file : str, default 'data/logo_match_cache.json'
+        The file for persisting team logo matches across runs.
     prediction_data : dict[str, dict[str, list[dict[str, Any]]]]
         Nested dictionary to store prediction data for summary export.
     storage_manager : StorageManager
@@ -103,7 +209,7 @@ class TipGenius:
     """
 
     # Set project root
-    project_root = Path(__file__).parent.parent.parent
+    project_root = PROJECT_ROOT
 
     # Initialize all attributes with default values
     export_to_kv = False
@@ -111,13 +217,24 @@ class TipGenius:
     store_api_results = False
     store_llm_results = False
     llm_attempts = 4
+    llm_concurrency = 4
+    combination_concurrency = 4
 
     api_data_folder = Path("data") / "api_result"
     llm_data_folder = Path("data") / "llm_data"
     match_predictions_folder = Path("data") / "match_predictions"
+    logo_match_cache_file = Path("data") / "logo_match_cache.json"
 
     prediction_data: dict[str, dict[str, list[dict[str, Any]]]] = defaultdict(dict)
 
+    # Logging handlers shared by all instances (set up once per process)
+    _console_handler: ClassVar[logging.Handler | None] = None
+    _file_handler: ClassVar[logging.Handler | None] = None
+    _log_listener: ClassVar[logging.handlers.QueueListener | None] = None
+
+    # Logo matchers shared by all instances, keyed by logo directory and cache file
+    _logo_matchers: ClassVar[dict[tuple[Path, Path], TeamLogoMatcher]] = {}
+
     def __init__(
         self,
         api_pipeline: BaseAPI,
@@ -133,6 +250,12 @@ class TipGenius:
         # Initialize class attributes
         self.storage_manager = None
         self.logo_matcher = None
+        # Progress of the combinations of a workflow (processed concurrently)
+        self._processed_count = 0
+        self._nr_total_combinations = 0
+        self._progress_lock = threading.Lock()
+        # LLM managers reused across combinations, keyed by provider and prompt type
+        self._llm_managers: dict[tuple[str, str], LLMManager] = {}
 
         # Initialize warning/error tracking for GitHub Actions visibility
         self.warnings = []
@@ -233,26 +356,46 @@ class TipGenius:
             )
 
     def _setup_logging(self, log_level: int) -> None:
-        """Set up logging configuration with optional file output in debug mode."""
+        """Set up logging configuration with optional file output in debug mode.
+
+        Records are passed through a queue to a background listener thread, which
+        writes them to the console (and debug log file), so logging calls do not
+        block on I/O. Handlers are created once per process and shared by all
+        instances, later calls only update the log level (and add the debug log
+        file if needed).
+        """
         # Create custom formatter
         formatter = logging.Formatter(
             fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
-        # Get root logger and clear existing handlers
         root_logger = logging.getLogger()
         root_logger.setLevel(log_level)
-        root_logger.handlers.clear()
 
-        # Always add console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        # Replace existing handlers with a queue handler on first setup only
+        if TipGenius._log_listener is None:
+            log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+            root_logger.handlers.clear()
+            root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            TipGenius._console_handler = console_handler
+
+            # Listener thread writes the records, stopped (and flushed) at exit
+            TipGenius._log_listener = logging.handlers.QueueListener(
+                log_queue,
+                console_handler,
+                respect_handler_level=True,
+            )
+            TipGenius._log_listener.start()
+            atexit.register(TipGenius._log_listener.stop)
+        if TipGenius._console_handler is not None:
+            TipGenius._console_handler.setLevel(log_level)
 
-        # Add file handler when debug mode is enabled
-        if self.debug:
+        # Add file handler when debug mode is enabled (once per process)
+        if self.debug and TipGenius._file_handler is None:
             # Check if file logging is enabled (defaults to True in debug mode)
             enable_file_logging = (
                 os.environ.get("DEBUG_LOG_FILE", "TRUE").upper() == "TRUE"
@@ -267,8 +410,12 @@ class TipGenius:
                 timestamp = datetime.now(UTC).strftime("%Y-%m-%d_%H-%M-%S")
                 log_filename = log_dir / f"tip_genius_{timestamp}.log"
 
-                # Create file handler with more detailed formatting
-                file_handler = logging.FileHandler(log_filename, encoding="utf-8")
+                # Create file handler (the file is opened on the first record)
+                file_handler = logging.FileHandler(
+                    log_filename,
+                    encoding="utf-8",
+                    delay=True,
+                )
                 file_handler.setLevel(logging.DEBUG)  # Always DEBUG level for file
 
                 # More detailed formatter for files
@@ -280,7 +427,11 @@ class TipGenius:
                     datefmt="%Y-%m-%d %H:%M:%S",
                 )
                 file_handler.setFormatter(file_formatter)
-                root_logger.addHandler(file_handler)
+                TipGenius._log_listener.handlers = (
+                    *TipGenius._log_listener.handlers,
+                    file_handler,
+                )
+                TipGenius._file_handler = file_handler
 
                 # Log the file location
                 logger.info("Debug logging enabled - log file: %s", log_filename)
@@ -353,7 +504,7 @@ class TipGenius:
         sport: str,
         api_name: str,
     ) -> None:
-        """Store the raw API result data in a JSON file in the specified data folder.
+        """Store the raw API result data in a gzipped JSON file in the data folder.
 
         Parameters
         ----------
@@ -375,43 +526,161 @@ class TipGenius:
             api_export_path = self.project_root / self.api_data_folder
             api_export_path.mkdir(parents=True, exist_ok=True)
 
-            # Generate a filename with a timestamp
-            timestamp = datetime.now(tz=UTC).strftime("%Y-%m-%d_%H-%M-%S")
-            filename = f"{timestamp}{suffix}.json"
+            # Generate a filename with a (UTC) timestamp
+            timestamp = time.strftime("%Y-%m-%d_%H-%M-%S", time.gmtime())
+            filename = f"{timestamp}{suffix}.json.gz"
             file_path = api_export_path / filename
 
-            # Write the raw API data to the JSON file
-            with file_path.open("w", encoding="utf-8") as json_file:
-                json.dump(api_result, json_file, ensure_ascii=False, indent=4)
+            # Write the raw API data to the JSON file (orjson emits UTF-8), the
+            # archived raw data is compressed (fast level, JSON compresses well)
+            file_path.write_bytes(
+                gzip.compress(
+                    orjson.dumps(api_result, option=orjson.OPT_INDENT_2),
+                    compresslevel=3,
+                ),
+            )
 
             logger.debug("API result stored successfully at: %s", file_path)
 
         except Exception:
             logger.exception("A problem occurred while storing API result: %s")
 
-    def _wait_before_retry(
-        self,
-        attempt: int,
-        api_error: bool,  # noqa: FBT001
-        request_duration: float,
-        rate_limit: float,
-    ) -> None:
-        """Wait before a retry attempt based on error type and rate limit.
+    def _wait_before_retry(self, attempt: int, *, api_error: bool) -> None:
+        """Wait before a retry attempt based on the error type.
 
-        Applies exponential backoff (3^(attempt+1)s) for API errors, using
-        max(rate_limit_interval, backoff) when a rate limit is configured.
-        For consistency failures, only rate limit spacing is applied.
+        Applies exponential backoff (3^(attempt+1)s) for API errors. Consistency
+        failures are retried right away, the spacing of requests is left to the
+        rate limiter of the LLMManager (shared by all rows of a provider).
         """
-        min_interval = (60.0 / rate_limit) * 1.1 if rate_limit > 0 else 0.0
         if api_error:
             backoff = float(3 ** (attempt + 1))
-            wait_time = max(min_interval, backoff)
             logger.debug(
-                "API error on attempt %d, backing off %.1fs", attempt + 1, wait_time
+                "API error on attempt %d, backing off %.1fs", attempt + 1, backoff
             )
-            time.sleep(wait_time)
-        elif min_interval > request_duration:
-            time.sleep(min_interval - request_duration)
+            time.sleep(backoff)
+
+    def _predict_row(
+        self,
+        llm: LLMManager,
+        llm_provider: str,
+        i: int,
+        user_prompt: str,
+        odds: tuple[float, float],
+    ) -> dict[str, Any] | None:
+        """Get the LLM prediction for a single row (with retries).
+
+        Only the first attempt may be answered from the LLM caches. An accepted
+        prediction (consistent with the odds and valid) is cached under the key of
+        the first attempt (base temperature), also if it was returned by a retry,
+        so that later identical requests reuse it.
+
+        Parameters
+        ----------
+        llm : LLMManager
+            The LLM manager to use.
+        llm_provider : str
+            The LLM provider name (for warnings).
+        i : int
+            The row index (for logging).
+        user_prompt : str
+            The odds summary of the match.
+        odds : tuple[float, float]
+            The home and away odds (for the consistency check).
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The last LLM response, or None if the row was skipped or failed.
+
+        """
+        try:
+            last_response = None
+            attempt = 0
+
+            for attempt in range(self.llm_attempts):
+                api_error = False
+
+                try:
+                    # Calculate temperature for retry attempts
+                    # Only increase temp for models starting at 0.0
+                    # Models with fixed temp (GPT-5) should not be modified
+                    base_temperature = llm.kwargs.get("temperature", 0.0)
+                    temperature = (
+                        base_temperature + 0.2 * attempt
+                        if base_temperature == 0.0
+                        else base_temperature
+                    )
+
+                    # Retries always request a new answer (bypassing the caches)
+                    prediction = llm.get_prediction(
+                        user_prompt=user_prompt,
+                        use_cache=attempt == 0,
+                        temperature=temperature,
+                    )
+                    response = parse_prediction(prediction)
+                    last_response = response
+
+                    if is_prediction_consistent(
+                        response["prediction"]["home"],
+                        response["prediction"]["away"],
+                        *odds,
+                    ):
+                        # Only accepted predictions are reused for identical requests,
+                        # stored for the first attempt (which reads the caches)
+                        if is_prediction_valid(
+                            response.get("reasoning"),
+                            response.get("outlook"),
+                            response["prediction"]["home"],
+                            response["prediction"]["away"],
+                        ):
+                            llm.cache_prediction(
+                                user_prompt,
+                                prediction,
+                                temperature=base_temperature,
+                            )
+                        break
+                    logger.debug(
+                        "Prediction inconsistent with odds for row %d, attempt %d",
+                        i + 1,
+                        attempt + 1,
+                    )
+
+                except Exception as e:
+                    api_error = True
+                    logger.warning(
+                        "LLM prediction attempt %d failed for row %d: %s",
+                        attempt + 1,
+                        i + 1,
+                        str(e),
+                    )
+
+                # Apply wait before next attempt (skip wait after last attempt)
+                if attempt < self.llm_attempts - 1:
+                    self._wait_before_retry(attempt=attempt, api_error=api_error)
+
+            if not last_response:
+                warning_msg = f"No valid LLM response for row {i + 1}, skipping..."
+                logger.warning(warning_msg)
+                self.add_warning(warning_msg, f"LLM processing for {llm_provider}")
+                return None
+
+            if attempt == self.llm_attempts - 1:
+                warning_msg = (
+                    f"Using inconsistent prediction for row {i + 1} after "
+                    f"{self.llm_attempts} failed attempts: {last_response}"
+                )
+                logger.warning(warning_msg)
+                self.add_warning(
+                    warning_msg, f"LLM consistency check for {llm_provider}"
+                )
+
+        except Exception as e:
+            warning_msg = f"Failed to process row {i + 1}: {e!s}"
+            logger.warning(warning_msg)
+            self.add_warning(warning_msg, f"Row processing for {llm_provider}")
+            return None  # Skip this row but continue processing others
+
+        return last_response
 
     def predict_results(
         self,
@@ -437,7 +706,13 @@ class TipGenius:
 
         """
         try:
-            llm = LLMManager(provider=llm_provider, prediction_type=prediction_type)
+            llm = self._llm_managers.get((llm_provider, prediction_type))
+            if llm is None:
+                llm = LLMManager(provider=llm_provider, prediction_type=prediction_type)
+                # Keep the first manager if another combination raced us here
+                llm = self._llm_managers.setdefault(
+                    (llm_provider, prediction_type), llm
+                )
         except Exception:
             logger.exception(
                 "Failed to initialize LLM provider %s",
@@ -445,118 +720,222 @@ class TipGenius:
             )
             return data  # Return unmodified dataframe if LLM initialization fails
 
-        def is_prediction_consistent(
-            p_home: int,
-            p_away: int,
-            o_home: float,
-            o_away: float,
-        ) -> bool:
-            return not (
-                (p_home > p_away and o_home >= o_away)
-                or (p_home < p_away and o_home <= o_away)
+        # Rows are independent: request them concurrently (the LLMManager rate
+        # limiter keeps the requests within the provider's rate limit)
+        # Rows with missing odds (0) are skipped, evaluated for all rows at once
+        inputs = data.select(
+            "odds_summary",
+            "odds_home",
+            "odds_away",
+            valid_odds=(pl.col("odds_home") != 0)
+            & (pl.col("odds_away") != 0)
+            & (pl.col("odds_draw") != 0),
+        )
+        valid_odds = inputs.get_column("valid_odds")
+        if logger.isEnabledFor(logging.DEBUG):
+            for i in valid_odds.not_().arg_true():
+                logger.debug("Odds are invalid for row %d, skipping...", i + 1)
+        row_indices = valid_odds.arg_true().to_list()
+        prompts = inputs.get_column("odds_summary").to_list()
+        odds_home = inputs.get_column("odds_home").to_list()
+        odds_away = inputs.get_column("odds_away").to_list()
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.llm_concurrency, len(row_indices))),
+            thread_name_prefix="llm",
+        ) as executor:
+            responses = list(
+                executor.map(
+                    lambda i: self._predict_row(
+                        llm,
+                        llm_provider,
+                        i,
+                        prompts[i],
+                        (odds_home[i], odds_away[i]),
+                    ),
+                    row_indices,
+                ),
             )
 
-        def validate_prediction(pred: dict) -> bool:
-            return (
-                pred["reasoning"]
-                and pred["outlook"]
-                and isinstance(pred["prediction"]["home"], int)
-                and isinstance(pred["prediction"]["away"], int)
+        # Collect the prediction results and update the DataFrame once at the end
+        prediction_columns = {
+            name: data.get_column(name).to_list()
+            for name in (
+                "reasoning",
+                "prediction_home",
+                "prediction_away",
+                "outlook",
+                "validity",
             )
-
-        for i in range(data.shape[0]):
-            if any(data[i, f"odds_{key}"] == 0 for key in ["home", "away", "draw"]):
-                logger.debug("Odds are invalid for row %d, skipping...", i + 1)
+        }
+        for i, last_response in zip(row_indices, responses, strict=True):
+            if last_response is None:
                 continue
 
             try:
-                last_response = None
-                attempt = 0
+                reasoning = last_response["reasoning"]
+                prediction_home = last_response["prediction"]["home"]
+                prediction_away = last_response["prediction"]["away"]
+                outlook = last_response["outlook"]
+                validity = is_prediction_valid(
+                    reasoning,
+                    outlook,
+                    prediction_home,
+                    prediction_away,
+                )
+                row_values = (
+                    reasoning,
+                    prediction_home,
+                    prediction_away,
+                    outlook,
+                    validity,
+                )
 
-                for attempt in range(self.llm_attempts):
-                    api_error = False
-                    request_start = time.time()
+            except Exception as e:
+                warning_msg = f"Failed to process row {i + 1}: {e!s}"
+                logger.warning(warning_msg)
+                self.add_warning(warning_msg, f"Row processing for {llm_provider}")
+                continue  # Skip this row but continue processing others
 
-                    try:
-                        # Calculate temperature for retry attempts
-                        # Only increase temp for models starting at 0.0
-                        # Models with fixed temp (GPT-5) should not be modified
-                        base_temperature = llm.kwargs.get("temperature", 0.0)
-                        temperature = (
-                            base_temperature + 0.2 * attempt
-                            if base_temperature == 0.0
-                            else base_temperature
-                        )
+            for values, value in zip(
+                prediction_columns.values(), row_values, strict=True
+            ):
+                values[i] = value
+
+        # Values are cast like single cell updates (invalid values become null)
+        return data.with_columns(
+            [
+                pl.Series(name, values, dtype=data.schema[name], strict=False)
+                for name, values in prediction_columns.items()
+            ],
+        )
 
-                        response = literal_eval(
-                            llm.get_prediction(
-                                user_prompt=data[i, "odds_summary"],
-                                temperature=temperature,
-                            ),
-                        )
-                        last_response = response
+    def _advance_progress(self, nr_combinations: int) -> int:
+        """Count started (or skipped) combinations, return the new progress count."""
+        with self._progress_lock:
+            self._processed_count += nr_combinations
+            return self._processed_count
 
-                        if is_prediction_consistent(
-                            response["prediction"]["home"],
-                            response["prediction"]["away"],
-                            data[i, "odds_home"],
-                            data[i, "odds_away"],
-                        ):
-                            break
-                        logger.debug(
-                            "Prediction inconsistent with odds for row %d, attempt %d",
-                            i + 1,
-                            attempt + 1,
-                        )
+    def predict_combination(
+        self,
+        api_result: dict[str, Any],
+        sport: str,
+        llm_provider: str,
+        prediction_type: str,
+        *,
+        named_teams: bool,
+        additional_info: bool,
+    ) -> list[dict[str, Any]]:
+        """Process the API data and predict the results for a single combination.
 
-                    except Exception as e:
-                        api_error = True
-                        logger.warning(
-                            "LLM prediction attempt %d failed for row %d: %s",
-                            attempt + 1,
-                            i + 1,
-                            str(e),
-                        )
+        Parameters
+        ----------
+        api_result : dict[str, Any]
+            The raw data retrieved from the API.
+        sport : str
+            The sport for which predictions are made.
+        llm_provider : str
+            The LLM provider to use for predictions.
+        prediction_type : str
+            The type of prediction to use.
+        named_teams : bool
+            Whether to use named teams or to anonymize them.
+        additional_info : bool
+            Whether to include additional information in the prediction.
 
-                    # Apply wait before next attempt (skip wait after last attempt)
-                    if attempt < self.llm_attempts - 1:
-                        self._wait_before_retry(
-                            attempt=attempt,
-                            api_error=api_error,
-                            request_duration=time.time() - request_start,
-                            rate_limit=llm.rate_limit,
-                        )
+        Returns
+        -------
+        list[dict[str, Any]]
+            The valid match predictions (without logos).
 
-                if not last_response:
-                    warning_msg = f"No valid LLM response for row {i + 1}, skipping..."
-                    logger.warning(warning_msg)
-                    self.add_warning(warning_msg, f"LLM processing for {llm_provider}")
-                    continue
+        """
+        processed_count = self._advance_progress(1)
+        logger.info(
+            "Processing combination %d/%d: %s, %s, Named Teams: %s, "
+            "Additional Info: %s",
+            processed_count,
+            self._nr_total_combinations,
+            llm_provider,
+            prediction_type,
+            named_teams,
+            additional_info,
+        )
 
-                if attempt == self.llm_attempts - 1:
-                    warning_msg = (
-                        f"Using inconsistent prediction for row {i + 1} after "
-                        f"{self.llm_attempts} failed attempts: {last_response}"
-                    )
-                    logger.warning(warning_msg)
-                    self.add_warning(
-                        warning_msg, f"LLM consistency check for {llm_provider}"
-                    )
+        data = self.api_pipeline.process_api_data(
+            api_result=api_result,
+            named_teams=named_teams,
+            additional_info=additional_info,
+        )
 
-                # Update DataFrame with prediction results
-                data[i, "reasoning"] = last_response["reasoning"]
-                data[i, "prediction_home"] = last_response["prediction"]["home"]
-                data[i, "prediction_away"] = last_response["prediction"]["away"]
-                data[i, "outlook"] = last_response["outlook"]
-                data[i, "validity"] = validate_prediction(last_response)
+        if self.debug and self.debug_limit > 0:
+            data = data.limit(self.debug_limit)
 
-            except Exception as e:
-                warning_msg = f"Failed to process row {i + 1}: {e!s}"
-                logger.warning(warning_msg)
-                self.add_warning(warning_msg, f"Row processing for {llm_provider}")
-                continue  # Skip this row but continue processing others
+        data_processed = self.predict_results(
+            data=data,
+            llm_provider=llm_provider,
+            prediction_type=prediction_type,
+        )
+
+        if self.store_llm_results:
+            self.store_llm_data(
+                data=data_processed,
+                sport=sport,
+                llm_provider=llm_provider,
+                prediction_type=prediction_type,
+                named_teams=named_teams,
+                additional_info=additional_info,
+            )
+
+        # Keep valid predictions only
+        return (
+            data_processed.filter(pl.col("validity").cast(pl.Boolean))
+            .select(
+                [
+                    "commence_time_str",
+                    "home_team",
+                    "away_team",
+                    "prediction_home",
+                    "prediction_away",
+                    "outlook",
+                    "reasoning",
+                ],
+            )
+            .to_dicts()
+        )
+
+    def _get_logo_matcher(self, logo_directory: Path) -> TeamLogoMatcher:
+        """Get the logo matcher for a directory, initialized once per process.
+
+        Parameters
+        ----------
+        logo_directory : Path
+            The directory containing the team logo files.
+
+        Returns
+        -------
+        TeamLogoMatcher
+            The (shared) logo matcher for the directory.
+
+        """
+        cache_file = self.project_root / self.logo_match_cache_file
+        key = (logo_directory, cache_file)
+        logo_matcher = TipGenius._logo_matchers.get(key)
+        if logo_matcher is None:
+            logo_matcher = TeamLogoMatcher(
+                logo_directory=logo_directory,
+                cache_file=cache_file,
+            )
+            TipGenius._logo_matchers[key] = logo_matcher
+            logger.debug("TeamLogoMatcher successfully initialized.")
+        return logo_matcher
 
-        return data
+    def refresh_logo_matcher(self) -> None:
+        """Discard the shared logo matchers, e.g. after the logo files changed.
+
+        The matchers are re-initialized on the next workflow execution.
+        """
+        TipGenius._logo_matchers.clear()
+        self.logo_matcher = None
 
     def save_results(
         self,
@@ -671,8 +1050,7 @@ class TipGenius:
                 full_path = self.project_root / team_logos_path
                 if full_path.exists():
                     try:
-                        self.logo_matcher = TeamLogoMatcher(logo_directory=full_path)
-                        logger.debug("TeamLogoMatcher successfully initialized.")
+                        self.logo_matcher = self._get_logo_matcher(full_path)
                     except Exception:
                         logger.warning("Failed to initialize logo matcher: %s")
                 else:
@@ -696,109 +1074,100 @@ class TipGenius:
                 )
                 return
 
-            nr_total_combinations = (
+            nr_sport_combinations = (
                 len(llm_provider_options)
                 * len(prediction_type_options)
                 * len(named_teams_options)
                 * len(additional_info_options)
-                * len(sports_list)
             )
+            self._nr_total_combinations = nr_sport_combinations * len(sports_list)
 
             logger.info(
                 "Starting workflow with %d total combinations",
-                nr_total_combinations,
+                self._nr_total_combinations,
             )
-            processed_count = 0
+            self._processed_count = 0
+
+            # Fetch the odds data for all sports concurrently (failures are logged)
+            logger.info("Retrieving odds for sports: %s", ", ".join(sports_list))
+            api_results = self.api_pipeline.fetch_many(sports_list)
+
+            # Combinations are independent, run them concurrently (results are
+            # collected in submission order to keep the export deterministic)
+            combination_futures = []
+            with ThreadPoolExecutor(
+                max_workers=self.combination_concurrency,
+            ) as executor:
+                for sport in sports_list:
+                    if sport not in api_results:
+                        # Skip this sport but continue with others
+                        self._advance_progress(nr_sport_combinations)
+                        continue
+                    api_result = api_results[sport]
 
-            for sport in sports_list:
-                logger.info("Retrieving odds for sport: %s", sport)
-
-                try:
-                    # Fetch the odds data
-                    api_result = self.api_pipeline.fetch_api_data(sport_key=sport)
-                    if self.store_api_results:
-                        self.store_api_data(
-                            api_result=api_result,
-                            sport=sport,
-                            api_name=self.api_pipeline.api_name,
-                        )
-                except Exception:
-                    logger.exception("Failed to fetch odds for sport %s", sport)
-                    continue  # Skip this sport but continue with others
-
-                combinations = product(
-                    llm_provider_options,
-                    prediction_type_options,
-                    named_teams_options,
-                    additional_info_options,
-                )
-
-                for (
-                    llm_provider,
-                    prediction_type,
-                    named_teams,
-                    additional_info,
-                ) in combinations:
-                    processed_count += 1
                     try:
-                        logger.info(
-                            "Processing combination %d/%d: %s, %s, Named Teams: %s, "
-                            "Additional Info: %s",
-                            processed_count,
-                            nr_total_combinations,
-                            llm_provider,
-                            prediction_type,
-                            named_teams,
-                            additional_info,
-                        )
+                        if self.store_api_results:
+                            self.store_api_data(
+                                api_result=api_result,
+                                sport=sport,
+                                api_name=self.api_pipeline.api_name,
+                            )
+                    except Exception:
+                        logger.exception("Failed to store API data for sport %s", sport)
+                        # Skip this sport but continue with others
+                        self._advance_progress(nr_sport_combinations)
+                        continue
+
+                    combinations = product(
+                        llm_provider_options,
+                        prediction_type_options,
+                        named_teams_options,
+                        additional_info_options,
+                    )
 
+                    for (
+                        llm_provider,
+                        prediction_type,
+                        named_teams,
+                        additional_info,
+                    ) in combinations:
                         if not api_result:
+                            self._advance_progress(1)
                             error_msg = "No valid API data"
                             logger.warning("No valid API data, skipping combination...")
                             self.add_failed_combination(sport, llm_provider, error_msg)
                             continue
 
-                        data = self.api_pipeline.process_api_data(
-                            api_result=api_result,
+                        future = executor.submit(
+                            self.predict_combination,
+                            api_result,
+                            sport,
+                            llm_provider,
+                            prediction_type,
                             named_teams=named_teams,
                             additional_info=additional_info,
                         )
-
-                        if self.debug and self.debug_limit > 0:
-                            data = data.limit(self.debug_limit)
-
-                        data_processed = self.predict_results(
-                            data=data,
-                            llm_provider=llm_provider,
-                            prediction_type=prediction_type,
+                        combination_futures.append(
+                            (
+                                sport,
+                                llm_provider,
+                                prediction_type,
+                                named_teams,
+                                additional_info,
+                                future,
+                            ),
                         )
 
-                        if self.store_llm_results:
-                            self.store_llm_data(
-                                data=data_processed,
-                                sport=sport,
-                                llm_provider=llm_provider,
-                                prediction_type=prediction_type,
-                                named_teams=named_teams,
-                                additional_info=additional_info,
-                            )
-
-                        # Keep valid predictions only
-                        valid_matches = (
-                            data_processed.filter(pl.col("validity").cast(pl.Boolean))
-                            .select(
-                                [
-                                    "commence_time_str",
-                                    "home_team",
-                                    "away_team",
-                                    "prediction_home",
-                                    "prediction_away",
-                                    "outlook",
-                                    "reasoning",
-                                ],
-                            )
-                            .to_dicts()
-                        )
+                for (
+                    sport,
+                    llm_provider,
+                    prediction_type,
+                    named_teams,
+                    additional_info,
+                    future,
+                ) in combination_futures:
+                    try:
+                        valid_matches = future.result()
 
                         # Save valid predictions
                         if valid_matches:
@@ -852,6 +1221,13 @@ class TipGenius:
                         sys.exit(1)
             raise  # Re-raise the exception after attempting to save data
 
+        finally:
+            # Release the KV connections and export threads, persist logo matches
+            if self.storage_manager:
+                self.storage_manager.close()
+            if self.logo_matcher:
+                self.logo_matcher.save_cache()
+
 
 # %% --------------------------------------------
 # * Default Workflow
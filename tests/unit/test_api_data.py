@@ -0,0 +1,70 @@
+"""Unit tests for the bookmaker odds selection of the Odds API.
+
+Offline tests (no API requests), run with::
+
+    uv run pytest tests/unit -v
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from lib.api_data import OddsAPI
+
+HOME, AWAY = "Home FC", "Away United"
+
+
+@pytest.fixture
+def odds_api(monkeypatch: pytest.MonkeyPatch) -> OddsAPI:
+    """Return an Odds API client with the priority 'first' > 'second'."""
+    monkeypatch.setenv("ODDS_API_KEY", "test-key")
+    api = OddsAPI()
+    api._bookmaker_ranks = {"first": 0, "second": 1}
+    return api
+
+
+def _bookmaker(key: str, home: float, away: float, draw: float | None) -> dict:
+    """Build a bookmaker entry with a single h2h market."""
+    outcomes = [{"name": HOME, "price": home}, {"name": AWAY, "price": away}]
+    if draw is not None:
+        outcomes.append({"name": "Draw", "price": draw})
+    return {"key": key, "markets": [{"key": "h2h", "outcomes": outcomes}]}
+
+
+def _match(*bookmakers: dict[str, Any]) -> dict[str, Any]:
+    """Build a match with the given bookmakers."""
+    return {"home_team": HOME, "away_team": AWAY, "bookmakers": list(bookmakers)}
+
+
+def test_selects_top_priority_bookmaker(odds_api: OddsAPI) -> None:
+    """The highest-priority bookmaker wins, regardless of the list order."""
+    match = _match(
+        _bookmaker("second", 2.0, 3.0, 3.5),
+        _bookmaker("first", 1.5, 5.5, 4.5),
+    )
+    assert odds_api._select_odds(match) == (1.5, 5.5, 4.5)
+
+
+def test_skips_incomplete_markets(odds_api: OddsAPI) -> None:
+    """Bookmakers without markets or without a draw price are ignored."""
+    match = _match(
+        {"key": "first", "markets": []},
+        _bookmaker("first", 1.5, 5.5, None),
+        _bookmaker("second", 2.0, 3.0, 3.5),
+    )
+    assert odds_api._select_odds(match) == (2.0, 3.0, 3.5)
+
+
+def test_ignores_bookmakers_outside_priority_list(odds_api: OddsAPI) -> None:
+    """Unknown bookmakers never provide odds (zeros if nothing else is offered)."""
+    unknown = _bookmaker("other", 1.1, 9.0, 7.0)
+    assert odds_api._select_odds(_match(unknown)) == (0.0, 0.0, 0.0)
+    assert odds_api._select_odds(_match()) == (0.0, 0.0, 0.0)
+
+
+def test_keeps_first_price_per_outcome(odds_api: OddsAPI) -> None:
+    """Duplicate outcomes within a market keep the first listed price."""
+    bookmaker = _bookmaker("first", 1.5, 5.5, 4.5)
+    bookmaker["markets"][0]["outcomes"].append({"name": HOME, "price": 9.9})
+    assert odds_api._select_odds(_match(bookmaker)) == (1.5, 5.5, 4.5)
@@ -0,0 +1,144 @@
+"""Unit tests for the persistent LLM response cache and its cache keys.
+
+Offline tests (no API requests), run with::
+
+    uv run pytest tests/unit -v
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from lib import llm_cache
+from lib.config_loader import load_yaml_config
+from lib.llm_cache import LLMResponseCache, get_llm_cache
+from lib.llm_manager import LLM_CONFIG_FILE, LLMManager
+from lib.llm_prompts import Prompt
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+KEY = b"request-key"
+USER_PROMPT = "Home : 1.5, Away : 5.5, Draw : 4.5"
+
+
+@pytest.fixture(autouse=True)
+def _reset_llm_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> Iterator[None]:
+    """Point the process wide cache to a temporary file (disabled by default)."""
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_FILE", tmp_path / "llm_responses.sqlite")
+    monkeypatch.setenv(llm_cache.LLM_CACHE_MODE_ENV_NAME, "off")
+    get_llm_cache.cache_clear()
+    yield
+    get_llm_cache.cache_clear()
+
+
+def _seed(path: Path, response: str = "cached") -> None:
+    """Store a response for KEY in a read/write cache."""
+    cache = LLMResponseCache(path, mode="on")
+    cache.put(KEY, response)
+    cache.close()
+
+
+def test_mode_on_reads_and_writes(tmp_path: Path) -> None:
+    """Mode 'on' returns stored responses and counts hits and misses."""
+    cache = LLMResponseCache(tmp_path / "cache.sqlite", mode="on")
+    assert cache.get(KEY) is None
+    cache.put(KEY, "first")
+    cache.put(KEY, "second")
+    assert cache.get(KEY) == "second"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_mode_read_only_does_not_write(tmp_path: Path) -> None:
+    """Mode 'read_only' returns existing responses but never stores new ones."""
+    path = tmp_path / "cache.sqlite"
+    _seed(path)
+    cache = LLMResponseCache(path, mode="read_only")
+    cache.put(KEY, "new")
+    cache.put(b"other-key", "new")
+    assert cache.get(KEY) == "cached"
+    assert cache.get(b"other-key") is None
+
+
+def test_mode_write_only_does_not_read(tmp_path: Path) -> None:
+    """Mode 'write_only' stores responses but never returns them."""
+    path = tmp_path / "cache.sqlite"
+    cache = LLMResponseCache(path, mode="write_only")
+    cache.put(KEY, "stored")
+    assert cache.get(KEY) is None
+    cache.close()
+
+    assert LLMResponseCache(path, mode="on").get(KEY) == "stored"
+
+
+@pytest.mark.parametrize("mode", ["off", "invalid"])
+def test_disabled_modes_return_no_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    mode: str,
+) -> None:
+    """Mode 'off' (and unknown modes) disable the process wide cache."""
+    monkeypatch.setenv(llm_cache.LLM_CACHE_MODE_ENV_NAME, mode)
+    assert get_llm_cache() is None
+
+
+@pytest.mark.parametrize(
+    ("mode", "readable", "writable"),
+    [
+        ("on", True, True),
+        ("READ_ONLY", True, False),
+        ("write_only", False, True),
+    ],
+)
+def test_environment_mode(
+    monkeypatch: pytest.MonkeyPatch,
+    mode: str,
+    *,
+    readable: bool,
+    writable: bool,
+) -> None:
+    """The process wide cache uses the mode of the environment variable."""
+    monkeypatch.setenv(llm_cache.LLM_CACHE_MODE_ENV_NAME, mode)
+    cache = get_llm_cache()
+    assert cache is not None
+    assert (cache.readable, cache.writable) == (readable, writable)
+    assert get_llm_cache() is cache
+
+
+def test_database_errors_are_cache_misses(tmp_path: Path) -> None:
+    """Database errors never escape, lookups miss and writes are skipped."""
+    cache = LLMResponseCache(tmp_path / "cache.sqlite", mode="on")
+    cache.put(KEY, "cached")
+    cache.close()
+    cache.put(KEY, "new")
+    assert cache.get(KEY) is None
+
+
+def _any_llm_provider(monkeypatch: pytest.MonkeyPatch) -> str:
+    """Return a configured LLM provider (with a dummy API key set)."""
+    for provider, config in load_yaml_config(LLM_CONFIG_FILE).items():
+        if isinstance(config, dict) and "api_key_env_name" in config:
+            monkeypatch.setenv(config["api_key_env_name"], "test-key")
+            return provider
+    pytest.skip("No LLM provider configured")
+
+
+def test_cache_key_depends_on_system_prompt(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Changing the system prompt (or the cache version) invalidates the keys."""
+    provider = _any_llm_provider(monkeypatch)
+    kwargs = {"temperature": 0.0}
+
+    llm = LLMManager(provider=provider)
+    key = llm._cache_key(USER_PROMPT, kwargs)
+    assert LLMManager(provider=provider)._cache_key(USER_PROMPT, kwargs) == key
+
+    monkeypatch.setitem(Prompt._RENDERED, "Default", "Changed instructions")
+    changed_prompt = LLMManager(provider=provider)
+    assert changed_prompt._cache_key(USER_PROMPT, kwargs) != key
+
+    monkeypatch.setattr("lib.llm_manager.LLM_CACHE_VERSION", -1)
+    assert llm._cache_key(USER_PROMPT, kwargs) != key
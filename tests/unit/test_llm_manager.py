@@ -0,0 +1,139 @@
+"""Unit tests for the rate limiter and the TTL cache of the LLM manager.
+
+Offline tests with a fake clock (no sleeping, no API requests), run with::
+
+    uv run pytest tests/unit -v
+"""
+
+from __future__ import annotations
+
+import pytest
+from lib import llm_manager
+from lib.llm_manager import TokenBucket, TTLCache
+
+
+class FakeTime:
+    """Stand-in for the time module with a manually advanced monotonic clock."""
+
+    def __init__(self, *, sleep_advances: bool = True) -> None:
+        """Start the clock at 1000s (recorded sleeps optionally advance it)."""
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+        self.sleep_advances = sleep_advances
+
+    def monotonic(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Record a sleep (and advance the clock if configured)."""
+        self.sleeps.append(seconds)
+        if self.sleep_advances:
+            self.now += seconds
+
+
+@pytest.fixture
+def fake_time(monkeypatch: pytest.MonkeyPatch) -> FakeTime:
+    """Replace the time module used by the LLM manager with a fake clock."""
+    clock = FakeTime()
+    monkeypatch.setattr(llm_manager, "time", clock)
+    return clock
+
+
+# %% --------------------------------------------
+# * TokenBucket
+
+
+def test_bucket_starts_full(fake_time: FakeTime) -> None:
+    """The first request is sent right away."""
+    TokenBucket(rate_per_sec=0.5).acquire()
+    assert fake_time.sleeps == []
+
+
+def test_bucket_spaces_requests(fake_time: FakeTime) -> None:
+    """Back-to-back requests wait for the refill interval (1 / rate)."""
+    bucket = TokenBucket(rate_per_sec=0.5)
+    bucket.acquire()
+    bucket.acquire()
+    assert fake_time.sleeps == [pytest.approx(2.0)]
+
+    # Time spent elsewhere counts towards the next token
+    fake_time.now += 1.5
+    bucket.acquire()
+    assert fake_time.sleeps[-1] == pytest.approx(0.5)
+
+
+def test_bucket_reserves_tokens_for_concurrent_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Requests at the same time queue up behind each other."""
+    clock = FakeTime(sleep_advances=False)
+    monkeypatch.setattr(llm_manager, "time", clock)
+    bucket = TokenBucket(rate_per_sec=2.0)
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5), pytest.approx(1.0), pytest.approx(1.5)]
+
+
+def test_bucket_does_not_save_up_beyond_capacity(fake_time: FakeTime) -> None:
+    """Idle time refills at most 'capacity' tokens (no burst afterwards)."""
+    bucket = TokenBucket(rate_per_sec=1.0, capacity=2)
+    fake_time.now += 3600
+    for _ in range(3):
+        bucket.acquire()
+    assert fake_time.sleeps == [pytest.approx(1.0)]
+
+
+def test_bucket_drain_blocks_for_retry_after(fake_time: FakeTime) -> None:
+    """After drain(seconds), the next request waits the seconds plus its token."""
+    bucket = TokenBucket(rate_per_sec=2.0)
+    bucket.drain(5)
+    bucket.acquire()
+    assert fake_time.sleeps == [pytest.approx(5.5)]
+
+
+def test_bucket_drain_keeps_longer_debt(fake_time: FakeTime) -> None:
+    """A shorter drain does not shorten an existing wait."""
+    bucket = TokenBucket(rate_per_sec=1.0)
+    bucket.drain(10)
+    bucket.drain(2)
+    bucket.acquire()
+    assert fake_time.sleeps == [pytest.approx(11.0)]
+
+
+# %% --------------------------------------------
+# * TTLCache
+
+
+def test_ttl_cache_expires_entries(fake_time: FakeTime) -> None:
+    """Entries are returned until their time to live has passed."""
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.put(b"a", "A")
+    fake_time.now += 59
+    assert cache.get(b"a") == "A"
+    fake_time.now += 2
+    assert cache.get(b"a") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_cache_evicts_least_recently_used(fake_time: FakeTime) -> None:
+    """A full cache drops the entry that was used least recently."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.put(b"a", "A")
+    cache.put(b"b", "B")
+    fake_time.now += 1
+    assert cache.get(b"a") == "A"  # "b" is now the least recently used
+    cache.put(b"c", "C")
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == "A"
+    assert cache.get(b"c") == "C"
+
+
+def test_ttl_cache_put_refreshes_entry(fake_time: FakeTime) -> None:
+    """Storing a key again replaces the value and restarts its time to live."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.put(b"a", "old")
+    fake_time.now += 8
+    cache.put(b"a", "new")
+    fake_time.now += 8
+    assert cache.get(b"a") == "new"
@@ -0,0 +1,47 @@
+"""Unit tests for the team name normalization of the logo matcher.
+
+Offline tests, run with::
+
+    uv run pytest tests/unit -v
+"""
+
+from __future__ import annotations
+
+import pytest
+from lib.team_matching import _slugify_name
+from slugify import slugify
+
+TEAM_NAMES = [
+    "Bayern Munich",
+    "Borussia Mönchengladbach",
+    "1. FC Köln",
+    "FC St. Pauli",
+    "Brighton & Hove Albion",
+    "Brighton &amp; Hove Albion",
+    "Wolverhampton Wanderers",
+    "Nottingham Forest",
+    "AFC Bournemouth",
+    "Atlético Madrid",
+    "Deportivo Alavés",
+    "Paris Saint-Germain",
+    "Olympique Lyonnais",
+    "Inter Milan",
+    "AS Roma",
+    "Fenerbahçe",
+    "Beşiktaş JK",
+    "Ferencváros",
+    "Dinamo Zagreb",
+    "Real Betis",
+    "1,000 Lakes FC",
+    "Team 1,5 (U-23)",
+    "  --Leading & trailing--  ",
+    "Al-Nassr's 'Team' (KSA)!",
+    "___",
+    "",
+]
+
+
+@pytest.mark.parametrize("name", TEAM_NAMES)
+def test_slugify_name_matches_slugify(name: str) -> None:
+    """The ASCII fast path returns the same slug as slugify."""
+    assert _slugify_name(name) == slugify(name, separator="_")